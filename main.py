@@ -206,7 +206,10 @@ async def scrape_single_player(
                 "Duration": f"{duration:.1f}s",
             }
 
-            email_service.send_daily_results(
+            # The SendGrid client blocks (including retry backoff), so keep it
+            # off the event loop while other players are still scraping
+            await asyncio.to_thread(
+                email_service.send_daily_results,
                 csv_files=[output_file],
                 metrics=metrics,
                 recipient=email_recipient,
@@ -502,7 +505,8 @@ Examples:
                 # Send error alert email if configured
                 if should_send_email:
                     logger.info(f"Sending error alert email to {email_recipient}")
-                    email_service.send_error_alert(
+                    await asyncio.to_thread(
+                        email_service.send_error_alert,
                         error=Exception("; ".join(result["errors"])),
                         scraper_type=args.type,
                         recipient=email_recipient,
@@ -525,7 +529,8 @@ Examples:
         # Send error alert email if configured
         if should_send_email and not args.all_players:
             logger.info(f"Sending error alert email to {email_recipient}")
-            email_service.send_error_alert(
+            await asyncio.to_thread(
+                email_service.send_error_alert,
                 error=e,
                 scraper_type=args.type,
                 recipient=email_recipient,
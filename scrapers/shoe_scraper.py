@@ -28,7 +28,9 @@ class ShoeScraper:
         config.validate()
         self.config = config
 
-        # Initialize services with dependency injection
+        # Initialize services with dependency injection; only a service we
+        # created ourselves is closed after the run
+        self._owns_kixstats_service = kixstats_service is None
         self.kixstats_service = kixstats_service or KixStatsService()
         self.csv_formatter = csv_formatter or ShoeCSVFormatter(config.output_file)
 
@@ -88,9 +90,13 @@ class ShoeScraper:
             logger.info(f"Using KixStats player ID: {player_id}")
 
             # Step 2: Scrape game shoe data from KixStats
-            game_shoes = await self.kixstats_service.scrape_player_games(
-                player_id=player_id, player_name=self.config.player_display_name
-            )
+            try:
+                game_shoes = await self.kixstats_service.scrape_player_games(
+                    player_id=player_id, player_name=self.config.player_display_name
+                )
+            finally:
+                if self._owns_kixstats_service:
+                    await self.kixstats_service.close()
 
             logger.info(f"Scraped {len(game_shoes)} games from KixStats")
 
@@ -49,8 +49,10 @@ class TunnelFitScraper:
         self.aggregation_service = aggregation_service or TunnelFitAggregationService()
         self.csv_formatter = csv_formatter or TunnelFitCSVFormatter(config.output_file)
 
-        # Initialize multi-source services (lazy initialization)
+        # Initialize multi-source services (lazy initialization); only a photo
+        # aggregation service we create ourselves is closed after the run
         self.photo_aggregation_service = photo_aggregation_service
+        self._owns_photo_aggregation_service = photo_aggregation_service is None
         self.vision_analysis_service = vision_analysis_service
         self.shopping_link_service = shopping_link_service
 
@@ -372,14 +374,18 @@ class TunnelFitScraper:
             f"Fetching photos from Instagram: {instagram_handle}, Twitter: {twitter_accounts}"
         )
 
-        unified_photos = await self.photo_aggregation_service.get_all_tunnel_photos(
-            player_name=self.config.player_display_name,
-            start_date=self.config.start_date,
-            end_date=self.config.end_date,
-            instagram_handle=instagram_handle,
-            twitter_accounts=twitter_accounts,
-            limit_per_source=self.config.limit,
-        )
+        try:
+            unified_photos = await self.photo_aggregation_service.get_all_tunnel_photos(
+                player_name=self.config.player_display_name,
+                start_date=self.config.start_date,
+                end_date=self.config.end_date,
+                instagram_handle=instagram_handle,
+                twitter_accounts=twitter_accounts,
+                limit_per_source=self.config.limit,
+            )
+        finally:
+            if self._owns_photo_aggregation_service:
+                await self.photo_aggregation_service.close()
 
         if not unified_photos:
             logger.warning("No photos found from any source")
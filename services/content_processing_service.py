@@ -3,6 +3,7 @@ Generic Content Processing Service
 Consolidates milestone and tunnel fit processing into a single reusable service
 """
 
+import asyncio
 import logging
 from datetime import date
 from typing import List, Optional, Callable, Any, Union
@@ -15,6 +16,9 @@ from services.boxscore_stats_service import BoxscoreStatsService
 
 logger = logging.getLogger(__name__)
 
+# AI parse calls in flight at once; keeps us under the provider's rate limits
+DEFAULT_MAX_CONCURRENT_PARSES = 8
+
 
 class ContentType(Enum):
     """Supported content types for processing"""
@@ -24,7 +28,7 @@ class ContentType(Enum):
     SHOE = "shoe"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ProcessingResult:
     """Generic result of content processing"""
 
@@ -44,9 +48,11 @@ class ContentProcessingService:
         self,
         ai_parser: Optional[AIParser] = None,
         boxscore_service: Optional[BoxscoreStatsService] = None,
+        max_concurrent_parses: int = DEFAULT_MAX_CONCURRENT_PARSES,
     ):
         self.ai_parser = ai_parser or AIParser()
         self.boxscore_service = boxscore_service or BoxscoreStatsService()
+        self.max_concurrent_parses = max_concurrent_parses
 
     async def process_tweets(
         self,
@@ -82,26 +88,49 @@ class ContentProcessingService:
             content_type, target_player, start_date, end_date
         )
 
+        parse = self._get_parser(content_type, target_player, additional_context)
+        if parse is None:
+            logger.warning(f"Unsupported content type: {content_type}")
+            return ProcessingResult(
+                content_items=[],
+                posts_processed=len(tweets),
+                items_found=0,
+                content_type=content_type,
+            )
+
         content_items = []
         posts_processed = 0
 
-        for tweet in tweets:
-            posts_processed += 1
+        # Parse all tweets concurrently; results come back in tweet order.
+        # Parser calls are blocking network requests, so run them off the loop
+        semaphore = asyncio.Semaphore(self.max_concurrent_parses)
 
-            # Process single tweet
-            item = await self._process_single_tweet(
-                tweet=tweet,
-                content_type=content_type,
-                target_player=target_player,
-                additional_context=additional_context,
-            )
+        async def process(tweet: ScrapedTweet):
+            async with semaphore:
+                try:
+                    item = await asyncio.to_thread(parse, tweet)
+                except Exception as e:
+                    logger.error(f"Error processing tweet {tweet.id}: {e}")
+                    return None
+
+            if item and logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    f"{content_type.value.capitalize()} extracted from tweet {tweet.id}: {self._get_item_description(item)}"
+                )
+            return item
+
+        items = await asyncio.gather(*(process(tweet) for tweet in tweets))
+
+        for tweet, item in zip(tweets, items):
+            posts_processed += 1
 
             if item:
                 # Apply quality filter if provided
                 if quality_filter and not quality_filter(item):
-                    logger.debug(
-                        f"Item filtered out by quality check: {self._get_item_description(item)}"
-                    )
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(
+                            f"Item filtered out by quality check: {self._get_item_description(item)}"
+                        )
                     continue
 
                 # Apply post-processor if provided (e.g., override social stats)
@@ -159,26 +188,29 @@ class ContentProcessingService:
 
         return None
 
-    async def _process_single_tweet(
+    def _get_parser(
         self,
-        tweet: ScrapedTweet,
         content_type: ContentType,
         target_player: str,
         additional_context: Optional[str] = None,
-    ) -> Optional[Union[MilestoneData, TunnelFitData, Any]]:
-        """Process a single tweet using the appropriate AI parser method"""
+    ) -> Optional[Callable[[ScrapedTweet], Any]]:
+        """Build the blocking per-tweet parse function for a content type"""
+
+        # Route to appropriate parser method based on content type
+        if content_type == ContentType.MILESTONE:
 
-        try:
-            # Route to appropriate parser method based on content type
-            if content_type == ContentType.MILESTONE:
-                item = self.ai_parser.parse_milestone_tweet(
+            def parse(tweet: ScrapedTweet) -> Optional[MilestoneData]:
+                return self.ai_parser.parse_milestone_tweet(
                     tweet_text=tweet.text,
                     target_player=target_player,
                     tweet_url=tweet.url,
                     tweet_id=tweet.id,
                     boxscore_context=additional_context,
                 )
-            elif content_type == ContentType.TUNNEL_FIT:
+
+        elif content_type == ContentType.TUNNEL_FIT:
+
+            def parse(tweet: ScrapedTweet) -> Optional[TunnelFitData]:
                 item = self.ai_parser.parse_tunnel_fit_tweet(
                     tweet_text=tweet.text,
                     target_player=target_player,
@@ -189,21 +221,13 @@ class ContentProcessingService:
                 # Check if it's actually a tunnel fit
                 if item and not item.is_tunnel_fit:
                     return None
-            else:
-                logger.warning(f"Unsupported content type: {content_type}")
-                return None
+                return item
 
-            if item:
-                logger.debug(
-                    f"{content_type.value.capitalize()} extracted from tweet {tweet.id}: {self._get_item_description(item)}"
-                )
-
-            return item
-
-        except Exception as e:
-            logger.error(f"Error processing tweet {tweet.id}: {e}")
+        else:
             return None
 
+        return parse
+
     def _get_item_description(
         self, item: Union[MilestoneData, TunnelFitData, Any]
     ) -> str:
@@ -217,6 +241,10 @@ class ContentProcessingService:
 
     def _log_confidence_scores(self, item: Union[MilestoneData, TunnelFitData, Any]):
         """Log confidence scores if available"""
+        # Skip building the messages when debug logging is off
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+
         if isinstance(item, MilestoneData):
             logger.debug(
                 f"Confidence - Milestone: {item.milestone_confidence:.2f}, "
@@ -4,23 +4,23 @@ Sends scraper results and alerts via email using SendGrid HTTP API
 """
 
 import logging
-import base64
+import asyncio
+import binascii
+import functools
+import gzip
+import io
+import os
+import random
+import shutil
+import time
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple, Any
 from datetime import datetime
+from urllib.error import URLError
 
+import aiohttp
+import orjson
 from sendgrid import SendGridAPIClient
-from sendgrid.helpers.mail import (
-    Mail,
-    Email,
-    To,
-    Content,
-    Attachment,
-    FileContent,
-    FileName,
-    FileType,
-    Disposition,
-)
 
 from config.settings import (
     SENDGRID_API_KEY,
@@ -30,6 +30,149 @@ from config.settings import (
 
 logger = logging.getLogger(__name__)
 
+SENDGRID_SEND_URL = "https://api.sendgrid.com/v3/mail/send"
+
+# Retry policy for transient SendGrid failures (rate limiting, 5xx, network)
+SEND_RETRIES = 3
+SEND_RETRY_BASE_DELAY = 1.0  # seconds, doubled after each failed attempt
+SEND_RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# Total timeout for one SendGrid request made over aiohttp
+SEND_TIMEOUT = 30  # seconds
+
+# Single-pass HTML escaping for values interpolated into email bodies
+_HTML_ESCAPE_TABLE = str.maketrans(
+    {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;"}
+)
+
+
+def _escape_html(value) -> str:
+    """Escape a value for safe inclusion in HTML markup"""
+    return str(value).translate(_HTML_ESCAPE_TABLE)
+
+
+# Static email layouts, filled in with str.format() per message
+_RESULTS_HTML_TEMPLATE = """
+        <html>
+          <head>
+            <style>
+              body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
+              .container {{ max-width: 600px; margin: 0 auto; padding: 20px; }}
+              .header {{ background-color: #4CAF50; color: white; padding: 20px; text-align: center; }}
+              .content {{ padding: 20px; background-color: #f9f9f9; }}
+              .metrics {{ width: 100%; border-collapse: collapse; margin: 20px 0; }}
+              .footer {{ margin-top: 20px; padding: 10px; text-align: center; color: #666; font-size: 12px; }}
+            </style>
+          </head>
+          <body>
+            <div class="container">
+              <div class="header">
+                <h1>📊 FanbaseHQ Scraper Results</h1>
+                <p>{date_str}</p>
+              </div>
+              <div class="content">
+                <h2>Summary</h2>
+                <table class="metrics">
+                  {metrics_html}
+                </table>
+
+                <h2>Attached Files</h2>
+                <ul>
+                  {csv_list_html}
+                </ul>
+
+                <p style="margin-top: 20px;">
+                  <strong>Next Steps:</strong> Download the attachments, decompress any .csv.gz files, and import the CSV files into your Supabase database.
+                </p>
+              </div>
+              <div class="footer">
+                <p>Automated email from FanbaseHQ Scraper</p>
+                <p>Generated at {timestamp}</p>
+              </div>
+            </div>
+          </body>
+        </html>
+        """
+
+_ERROR_HTML_TEMPLATE = """
+        <html>
+          <head>
+            <style>
+              body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
+              .container {{ max-width: 600px; margin: 0 auto; padding: 20px; }}
+              .header {{ background-color: #f44336; color: white; padding: 20px; text-align: center; }}
+              .content {{ padding: 20px; background-color: #f9f9f9; }}
+              .error-box {{ background-color: #ffebee; border-left: 4px solid #f44336; padding: 15px; margin: 20px 0; }}
+              .context {{ width: 100%; border-collapse: collapse; margin: 20px 0; }}
+              .footer {{ margin-top: 20px; padding: 10px; text-align: center; color: #666; font-size: 12px; }}
+            </style>
+          </head>
+          <body>
+            <div class="container">
+              <div class="header">
+                <h1>⚠️ Scraper Error Alert</h1>
+                <p>{scraper_type} scraper failed</p>
+              </div>
+              <div class="content">
+                <h2>Error Details</h2>
+                <div class="error-box">
+                  <p><strong>Error Type:</strong> {error_type}</p>
+                  <p><strong>Message:</strong> {error_message}</p>
+                </div>
+
+                {context_section}
+
+                <p style="margin-top: 20px;">
+                  <strong>Action Required:</strong> Please check the scraper logs for more details and resolve the issue.
+                </p>
+              </div>
+              <div class="footer">
+                <p>Automated alert from FanbaseHQ Scraper</p>
+                <p>Generated at {timestamp}</p>
+              </div>
+            </div>
+          </body>
+        </html>
+        """
+
+# Read size for attachment encoding; a multiple of 3 so each chunk encodes
+# to base64 without padding and chunks can be concatenated directly
+_ENCODE_CHUNK_SIZE = 57 * 1024
+_READ_BUFFER_SIZE = 1 << 20  # 1 MiB
+
+# Attachments larger than this are sent gzipped (CSV typically shrinks 5-10x)
+ATTACHMENT_GZIP_THRESHOLD = 100_000  # bytes
+_GZIP_COMPRESS_LEVEL = 6
+
+
+@functools.lru_cache(maxsize=32)
+def _encoded_attachment(
+    path_str: str, mtime_ns: int, size: int, compress: bool = False
+) -> str:
+    """
+    Base64-encode a file's contents, cached by (path, mtime, size)
+
+    The same daily CSV set is often attached to several emails; the mtime/size
+    parts of the key make sure a rewritten file is re-encoded. With compress,
+    the contents are gzipped before encoding.
+    """
+    buf = io.BytesIO()
+    with open(path_str, "rb", buffering=_READ_BUFFER_SIZE) as f:
+        if hasattr(os, "posix_fadvise"):
+            # Hint the kernel to read ahead aggressively (Linux only)
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+        if compress:
+            with gzip.GzipFile(
+                fileobj=buf, mode="wb", compresslevel=_GZIP_COMPRESS_LEVEL
+            ) as gz:
+                shutil.copyfileobj(f, gz, _ENCODE_CHUNK_SIZE)
+            return binascii.b2a_base64(buf.getvalue(), newline=False).decode("ascii")
+
+        while chunk := f.read(_ENCODE_CHUNK_SIZE):
+            buf.write(binascii.b2a_base64(chunk, newline=False))
+    return buf.getvalue().decode("ascii")
+
 
 class EmailService:
     """Service for sending scraper results and alerts via email using SendGrid HTTP API"""
@@ -41,6 +184,8 @@ class EmailService:
     ):
         self.api_key = api_key or SENDGRID_API_KEY
         self.from_email = from_email or SENDGRID_FROM_EMAIL
+        self._sendgrid_client: Optional[SendGridAPIClient] = None
+        self._sender = {"email": self.from_email}
 
         if not self.api_key:
             logger.warning(
@@ -71,50 +216,122 @@ class EmailService:
         Returns:
             True if email sent successfully, False otherwise
         """
+        # Check configuration before reading and encoding any attachments
+        if not self._is_configured() or not recipient:
+            logger.error("SendGrid not configured or no recipient - skipping email")
+            return False
+
         try:
-            logger.info("=== Starting send_daily_results ===")
+            logger.debug("Starting send_daily_results")
 
-            # Generate subject
-            if not subject:
-                date_str = datetime.now().strftime("%Y-%m-%d")
-                subject = f"FanbaseHQ Scraper Results - {date_str}"
-            logger.info(f"Subject generated: {subject}")
+            message = self._build_results_message(
+                csv_files, metrics, recipient, datetime.now(), subject
+            )
 
-            # Generate HTML body
-            logger.info("Generating HTML body...")
-            html_body = self._generate_results_html(metrics, csv_files)
-            logger.info(f"HTML body generated: {len(html_body)} bytes")
+            # Send email via SendGrid API
+            return self._send_via_sendgrid(message, recipient)
 
-            # Create SendGrid message
-            logger.info("Creating SendGrid Mail object...")
-            message = Mail(
-                from_email=Email(self.from_email),
-                to_emails=To(recipient),
-                subject=subject,
-                html_content=Content("text/html", html_body),
-            )
+        except Exception as e:
+            logger.error(f"Failed to send daily results email: {e}", exc_info=True)
+            return False
 
-            # Attach CSV files
-            logger.info(f"Attaching {len(csv_files)} CSV files...")
-            for i, csv_file in enumerate(csv_files, 1):
-                if not csv_file.exists():
-                    logger.warning(f"CSV file not found: {csv_file}")
-                    continue
+    async def send_daily_results_bulk(
+        self,
+        csv_files: List[Path],
+        metrics: Dict,
+        recipients: List[str],
+        subject: Optional[str] = None,
+        max_concurrent: int = 5,
+    ) -> Dict[str, bool]:
+        """
+        Send daily scraper results to several recipients concurrently
 
-                logger.info(f"Attaching file {i}/{len(csv_files)}: {csv_file.name}")
-                self._attach_file_to_sendgrid(message, csv_file)
-                logger.info(f"File {i}/{len(csv_files)} attached successfully")
+        The message and its attachments are built once and posted to the
+        SendGrid API for each recipient over a shared aiohttp session.
 
-            logger.info("All attachments complete, preparing to send...")
+        Args:
+            csv_files: List of CSV file paths to attach
+            metrics: Dictionary with scraping metrics
+            recipients: Email addresses to send to
+            subject: Optional custom subject line
+            max_concurrent: Maximum number of in-flight SendGrid requests
 
-            # Send email via SendGrid API
-            result = self._send_via_sendgrid(message, recipient)
-            logger.info(f"Send result: {result}")
-            return result
+        Returns:
+            Dictionary mapping each recipient to whether its email was sent
+        """
+        if not recipients:
+            return {}
+
+        if not self._is_configured():
+            logger.error("SendGrid not configured - skipping email")
+            return {recipient: False for recipient in recipients}
 
+        try:
+            message = self._build_results_message(
+                csv_files, metrics, recipients[0], datetime.now(), subject
+            )
         except Exception as e:
-            logger.error(f"Failed to send daily results email: {e}", exc_info=True)
-            return False
+            logger.error(f"Failed to build daily results email: {e}", exc_info=True)
+            return {recipient: False for recipient in recipients}
+
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+        }
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def send_one(session: aiohttp.ClientSession, recipient: str) -> bool:
+            # Same message for everyone; only the personalizations differ
+            body = orjson.dumps(
+                {**message, "personalizations": [{"to": [{"email": recipient}]}]}
+            )
+            async with semaphore:
+                backoff = SEND_RETRY_BASE_DELAY
+                for attempt in range(1, SEND_RETRIES + 1):
+                    try:
+                        async with session.post(
+                            SENDGRID_SEND_URL, data=body, headers=headers
+                        ) as response:
+                            if response.status in (200, 201, 202):
+                                logger.info(f"Email sent successfully to {recipient}")
+                                return True
+                            error_text = await response.text()
+                            error = f"HTTP {response.status} - {error_text}"
+                            transient = response.status in SEND_RETRY_STATUS_CODES
+                    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                        error = str(e) or type(e).__name__
+                        transient = True
+                    except Exception as e:
+                        logger.error(f"Failed to send email to {recipient}: {e}")
+                        return False
+
+                    if transient and attempt < SEND_RETRIES:
+                        delay = backoff + random.random() * 0.5
+                        logger.warning(
+                            "Transient SendGrid error for %s (attempt %d/%d): %s - retrying in %.1fs",
+                            recipient,
+                            attempt,
+                            SEND_RETRIES,
+                            error,
+                            delay,
+                        )
+                        await asyncio.sleep(delay)
+                        backoff *= 2
+                        continue
+
+                    logger.error(f"Failed to send email to {recipient}: {error}")
+                    return False
+
+                return False
+
+        async with aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=SEND_TIMEOUT)
+        ) as session:
+            results = await asyncio.gather(
+                *(send_one(session, recipient) for recipient in recipients)
+            )
+
+        return dict(zip(recipients, results))
 
     def send_error_alert(
         self,
@@ -141,16 +358,11 @@ class EmailService:
 
             # Generate HTML body
             html_body = self._generate_error_html(
-                error, scraper_type, additional_context
+                error, scraper_type, datetime.now(), additional_context
             )
 
             # Create SendGrid message
-            message = Mail(
-                from_email=Email(self.from_email),
-                to_emails=To(recipient),
-                subject=subject,
-                html_content=Content("text/html", html_body),
-            )
+            message = self._new_message(recipient, subject, html_body)
 
             # Send email via SendGrid API
             return self._send_via_sendgrid(message, recipient)
@@ -193,12 +405,7 @@ class EmailService:
             )
 
             # Create SendGrid message
-            message = Mail(
-                from_email=Email(self.from_email),
-                to_emails=To(recipient),
-                subject=subject,
-                html_content=Content("text/html", html_body),
-            )
+            message = self._new_message(recipient, subject, html_body)
 
             return self._send_via_sendgrid(message, recipient)
 
@@ -206,177 +413,219 @@ class EmailService:
             logger.error(f"Failed to send test email: {e}")
             return False
 
-    def _attach_file_to_sendgrid(self, message: Mail, file_path: Path):
-        """Attach a file to a SendGrid Mail object"""
+    def _is_configured(self) -> bool:
+        """Check that the SendGrid API key and sender address are set"""
+        return bool(self.api_key and self.from_email)
+
+    def _build_results_message(
+        self,
+        csv_files: List[Path],
+        metrics: Dict,
+        recipient: str,
+        now: datetime,
+        subject: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Build the SendGrid mail/send payload for a daily results email"""
+        # Generate subject
+        if not subject:
+            date_str = now.strftime("%Y-%m-%d")
+            subject = f"FanbaseHQ Scraper Results - {date_str}"
+
+        # Stat each file once; the HTML list and attachments share the result
+        file_info = self._stat_csv_files(csv_files)
+
+        # Generate HTML body
+        html_body = self._generate_results_html(metrics, file_info, now)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("HTML body generated: %d bytes", len(html_body))
+
+        # Create SendGrid message
+        message = self._new_message(recipient, subject, html_body)
+
+        # Attach CSV files
+        for csv_file, stat in file_info:
+            self._attach_file_to_sendgrid(message, csv_file, stat)
+
+        return message
+
+    def _new_message(
+        self, recipient: str, subject: str, html_body: str
+    ) -> Dict[str, Any]:
+        """
+        Create a SendGrid v3 mail/send payload from the shared sender
+
+        Payloads are plain dicts in the API's JSON shape, which
+        SendGridAPIClient.send() accepts directly without the Mail helpers.
+        """
+        return {
+            "from": self._sender,
+            "personalizations": [{"to": [{"email": recipient}]}],
+            "subject": subject,
+            "content": [{"type": "text/html", "value": html_body}],
+        }
+
+    @staticmethod
+    def _stat_csv_files(csv_files: List[Path]) -> List[Tuple[Path, os.stat_result]]:
+        """Stat each CSV file once, skipping any that do not exist"""
+        file_info = []
+        for csv_file in csv_files:
+            try:
+                file_info.append((csv_file, csv_file.stat()))
+            except FileNotFoundError:
+                logger.warning(f"CSV file not found: {csv_file}")
+        return file_info
+
+    @staticmethod
+    def _attachment_filename(file_path: Path, stat: os.stat_result) -> Tuple[str, bool]:
+        """Return the attachment filename for a file and whether it is gzipped"""
+        compress = stat.st_size > ATTACHMENT_GZIP_THRESHOLD
+        return (f"{file_path.name}.gz" if compress else file_path.name), compress
+
+    def _attach_file_to_sendgrid(
+        self,
+        message: Dict[str, Any],
+        file_path: Path,
+        stat: Optional[os.stat_result] = None,
+    ):
+        """Attach a file to a SendGrid mail/send payload"""
         try:
-            logger.debug(f"Reading file: {file_path}")
-            with open(file_path, "rb") as f:
-                file_data = f.read()
-            logger.debug(f"File read complete: {len(file_data)} bytes")
-
-            logger.debug("Encoding to base64...")
-            encoded_file = base64.b64encode(file_data).decode()
-            logger.debug("Base64 encoding complete")
-
-            logger.debug("Creating SendGrid Attachment...")
-            attachment = Attachment(
-                FileContent(encoded_file),
-                FileName(file_path.name),
-                FileType("text/csv"),
-                Disposition("attachment"),
+            if stat is None:
+                stat = file_path.stat()
+            filename, compress = self._attachment_filename(file_path, stat)
+            encoded_file = _encoded_attachment(
+                str(file_path), stat.st_mtime_ns, stat.st_size, compress
             )
-            logger.debug("Attachment created")
 
-            logger.debug("Adding attachment to message...")
-            message.add_attachment(attachment)
-            logger.debug(f"Attached file: {file_path.name}")
+            message.setdefault("attachments", []).append(
+                {
+                    "content": encoded_file,
+                    "filename": filename,
+                    "type": "application/gzip" if compress else "text/csv",
+                    "disposition": "attachment",
+                }
+            )
+            logger.debug("Attached file: %s (%d bytes)", file_path.name, stat.st_size)
 
         except Exception as e:
             logger.error(f"Failed to attach file {file_path}: {e}", exc_info=True)
 
-    def _send_via_sendgrid(self, message: Mail, recipient: str) -> bool:
-        """Send email via SendGrid HTTP API"""
-        try:
-            logger.info(f"Sending email to {recipient} via SendGrid API")
+    def _get_sendgrid_client(self) -> SendGridAPIClient:
+        """Get the shared SendGrid API client, creating it on first use"""
+        if self._sendgrid_client is None:
+            logger.debug("Creating SendGrid API client")
+            self._sendgrid_client = SendGridAPIClient(self.api_key)
+        return self._sendgrid_client
+
+    @staticmethod
+    def _is_transient_send_error(error: Exception) -> bool:
+        """Check whether a SendGrid send failure is worth retrying"""
+        # python_http_client raises HTTPError subclasses carrying status_code
+        status_code = getattr(error, "status_code", None)
+        if status_code is not None:
+            return status_code in SEND_RETRY_STATUS_CODES
+        return isinstance(error, (URLError, TimeoutError, ConnectionError))
+
+    def _send_via_sendgrid(self, message: Dict[str, Any], recipient: str) -> bool:
+        """
+        Send email via SendGrid HTTP API, retrying transient failures
 
-            if not self.api_key:
-                logger.error("SendGrid API key not configured")
-                return False
+        Blocks (including retry backoff sleeps); async callers should run the
+        public send methods through asyncio.to_thread.
+        """
+        logger.info(f"Sending email to {recipient} via SendGrid API")
 
-            logger.info("Creating SendGrid API client...")
-            sg = SendGridAPIClient(self.api_key)
+        if not self.api_key:
+            logger.error("SendGrid API key not configured")
+            return False
 
-            logger.info("Sending email via HTTPS...")
-            response = sg.send(message)
+        backoff = SEND_RETRY_BASE_DELAY
+        for attempt in range(1, SEND_RETRIES + 1):
+            try:
+                response = self._get_sendgrid_client().send(message)
+            except Exception as e:
+                if attempt < SEND_RETRIES and self._is_transient_send_error(e):
+                    delay = backoff + random.random() * 0.5
+                    logger.warning(
+                        "Transient SendGrid error (attempt %d/%d): %s - retrying in %.1fs",
+                        attempt,
+                        SEND_RETRIES,
+                        e,
+                        delay,
+                    )
+                    time.sleep(delay)
+                    backoff *= 2
+                    continue
+                logger.error(f"Failed to send email via SendGrid: {e}", exc_info=True)
+                return False
 
-            logger.info(f"SendGrid response status: {response.status_code}")
-            logger.debug(f"SendGrid response body: {response.body}")
-            logger.debug(f"SendGrid response headers: {response.headers}")
+            logger.debug("SendGrid response status: %s", response.status_code)
+            logger.debug("SendGrid response body: %s", response.body)
+            logger.debug("SendGrid response headers: %s", response.headers)
 
             if response.status_code in [200, 201, 202]:
                 logger.info(f"Email sent successfully to {recipient}")
                 return True
-            else:
-                logger.error(
-                    f"SendGrid returned unexpected status: {response.status_code}"
-                )
-                return False
 
-        except Exception as e:
-            logger.error(f"Failed to send email via SendGrid: {e}", exc_info=True)
+            logger.error(f"SendGrid returned unexpected status: {response.status_code}")
             return False
 
-    def _generate_results_html(self, metrics: Dict, csv_files: List[Path]) -> str:
-        """Generate HTML body for results email"""
-        date_str = datetime.now().strftime("%Y-%m-%d")
+        return False
 
-        # Build CSV file list
-        csv_list_html = ""
-        for csv_file in csv_files:
-            if csv_file.exists():
-                size_kb = csv_file.stat().st_size / 1024
-                csv_list_html += f"<li>{csv_file.name} ({size_kb:.1f} KB)</li>"
+    def _generate_results_html(
+        self,
+        metrics: Dict,
+        file_info: List[Tuple[Path, os.stat_result]],
+        now: datetime,
+    ) -> str:
+        """Generate HTML body for results email"""
+        date_str = now.strftime("%Y-%m-%d")
+
+        # Build attachment list, named as attached (large files are gzipped)
+        csv_items = []
+        for csv_file, stat in file_info:
+            filename, compressed = self._attachment_filename(csv_file, stat)
+            size = f"{stat.st_size / 1024:.1f} KB"
+            if compressed:
+                size += " before gzip compression"
+            csv_items.append(f"<li>{_escape_html(filename)} ({size})</li>")
+        csv_list_html = "".join(csv_items)
 
         # Build metrics HTML
-        metrics_html = ""
-        for key, value in metrics.items():
-            metrics_html += f"<tr><td style='padding: 8px; border-bottom: 1px solid #ddd;'>{key}</td><td style='padding: 8px; border-bottom: 1px solid #ddd;'><strong>{value}</strong></td></tr>"
-
-        html = f"""
-        <html>
-          <head>
-            <style>
-              body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
-              .container {{ max-width: 600px; margin: 0 auto; padding: 20px; }}
-              .header {{ background-color: #4CAF50; color: white; padding: 20px; text-align: center; }}
-              .content {{ padding: 20px; background-color: #f9f9f9; }}
-              .metrics {{ width: 100%; border-collapse: collapse; margin: 20px 0; }}
-              .footer {{ margin-top: 20px; padding: 10px; text-align: center; color: #666; font-size: 12px; }}
-            </style>
-          </head>
-          <body>
-            <div class="container">
-              <div class="header">
-                <h1>📊 FanbaseHQ Scraper Results</h1>
-                <p>{date_str}</p>
-              </div>
-              <div class="content">
-                <h2>Summary</h2>
-                <table class="metrics">
-                  {metrics_html}
-                </table>
-
-                <h2>Attached Files</h2>
-                <ul>
-                  {csv_list_html}
-                </ul>
-
-                <p style="margin-top: 20px;">
-                  <strong>Next Steps:</strong> Download and import the CSV files into your Supabase database.
-                </p>
-              </div>
-              <div class="footer">
-                <p>Automated email from FanbaseHQ Scraper</p>
-                <p>Generated at {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}</p>
-              </div>
-            </div>
-          </body>
-        </html>
-        """
-
-        return html
+        metrics_html = "".join(
+            f"<tr><td style='padding: 8px; border-bottom: 1px solid #ddd;'>{_escape_html(key)}</td><td style='padding: 8px; border-bottom: 1px solid #ddd;'><strong>{_escape_html(value)}</strong></td></tr>"
+            for key, value in metrics.items()
+        )
+
+        return _RESULTS_HTML_TEMPLATE.format(
+            date_str=date_str,
+            metrics_html=metrics_html,
+            csv_list_html=csv_list_html,
+            timestamp=now.strftime("%Y-%m-%d %H:%M:%S"),
+        )
 
     def _generate_error_html(
         self,
         error: Exception,
         scraper_type: str,
+        now: datetime,
         additional_context: Optional[Dict] = None,
     ) -> str:
         """Generate HTML body for error alert email"""
-        context_html = ""
-        if additional_context:
-            for key, value in additional_context.items():
-                context_html += f"<tr><td style='padding: 8px; border-bottom: 1px solid #ddd;'>{key}</td><td style='padding: 8px; border-bottom: 1px solid #ddd;'>{value}</td></tr>"
-
-        html = f"""
-        <html>
-          <head>
-            <style>
-              body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
-              .container {{ max-width: 600px; margin: 0 auto; padding: 20px; }}
-              .header {{ background-color: #f44336; color: white; padding: 20px; text-align: center; }}
-              .content {{ padding: 20px; background-color: #f9f9f9; }}
-              .error-box {{ background-color: #ffebee; border-left: 4px solid #f44336; padding: 15px; margin: 20px 0; }}
-              .context {{ width: 100%; border-collapse: collapse; margin: 20px 0; }}
-              .footer {{ margin-top: 20px; padding: 10px; text-align: center; color: #666; font-size: 12px; }}
-            </style>
-          </head>
-          <body>
-            <div class="container">
-              <div class="header">
-                <h1>⚠️ Scraper Error Alert</h1>
-                <p>{scraper_type} scraper failed</p>
-              </div>
-              <div class="content">
-                <h2>Error Details</h2>
-                <div class="error-box">
-                  <p><strong>Error Type:</strong> {type(error).__name__}</p>
-                  <p><strong>Message:</strong> {str(error)}</p>
-                </div>
-
-                {"<h2>Context</h2><table class='context'>" + context_html + "</table>" if context_html else ""}
-
-                <p style="margin-top: 20px;">
-                  <strong>Action Required:</strong> Please check the scraper logs for more details and resolve the issue.
-                </p>
-              </div>
-              <div class="footer">
-                <p>Automated alert from FanbaseHQ Scraper</p>
-                <p>Generated at {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}</p>
-              </div>
-            </div>
-          </body>
-        </html>
-        """
-
-        return html
+        context_html = "".join(
+            f"<tr><td style='padding: 8px; border-bottom: 1px solid #ddd;'>{_escape_html(key)}</td><td style='padding: 8px; border-bottom: 1px solid #ddd;'>{_escape_html(value)}</td></tr>"
+            for key, value in (additional_context or {}).items()
+        )
+
+        context_section = (
+            f"<h2>Context</h2><table class='context'>{context_html}</table>"
+            if context_html
+            else ""
+        )
+
+        return _ERROR_HTML_TEMPLATE.format(
+            scraper_type=_escape_html(scraper_type),
+            error_type=_escape_html(type(error).__name__),
+            error_message=_escape_html(error),
+            context_section=context_section,
+            timestamp=now.strftime("%Y-%m-%d %H:%M:%S"),
+        )
@@ -3,19 +3,76 @@ Instagram Photo Service
 Fetches tunnel fit photos from Instagram using Scrape Creators API
 """
 
+import json
 import logging
 import asyncio
 import aiohttp
+import orjson
 from datetime import datetime, timedelta, timezone
-from typing import List, Optional, Dict, Any
-from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Dict, Any, Tuple
+from dataclasses import dataclass, asdict
+from collections import OrderedDict
+import functools
 import hashlib
 import re
 
 logger = logging.getLogger(__name__)
 
-
-@dataclass
+# Post lists persisted between runs so warm starts skip the API
+DEFAULT_CACHE_FILE = (
+    Path(__file__).parent.parent / "config" / "instagram_posts_cache.json"
+)
+
+# Minimum spacing between Scrape Creators requests, shared by all handles
+MIN_REQUEST_INTERVAL = 0.5  # seconds
+
+# Retry policy for rate-limited and 5xx Scrape Creators responses
+API_RETRIES = 3
+API_RETRY_BASE_DELAY = 2.0  # seconds, doubled after each failed attempt
+API_RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# Default caption keywords for tunnel fit detection
+TUNNEL_FIT_KEYWORDS = (
+    "tunnel",
+    "pregame",
+    "gameday",
+    "game day",
+    "arrival",
+    "fit",
+    "outfit",
+    "ootd",
+    "fashion",
+    "style",
+    "wearing",
+)
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_keyword_matcher(
+    keywords: Tuple[str, ...],
+) -> Tuple[Optional[re.Pattern], Tuple[str, ...]]:
+    """
+    Compile keywords into a single regex that finds every keyword in one scan
+
+    The lookahead lets matches overlap ("fit" inside "outfit"). Keywords that
+    are a prefix of another keyword could be hidden by the longer alternative
+    at the same position, so those are returned separately for a plain
+    substring check.
+    """
+    unique = tuple(dict.fromkeys(keywords))
+    prefix_keywords = tuple(
+        k for k in unique if any(o != k and o.startswith(k) for o in unique)
+    )
+    scanned = [k for k in unique if k not in prefix_keywords]
+    if not scanned:
+        return None, prefix_keywords
+
+    pattern = "|".join(re.escape(k) for k in scanned)
+    return re.compile(f"(?=({pattern}))"), prefix_keywords
+
+
+@dataclass(slots=True)
 class InstagramPost:
     """Instagram post data"""
 
@@ -34,29 +91,71 @@ class InstagramPost:
 class InstagramPhotoService:
     """Service for fetching tunnel fit photos from Instagram via Scrape Creators API"""
 
-    def __init__(self, api_key: str, cache_hours: int = 6):
+    IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".gif", ".webp")
+    CDN_INDICATOR_RE = re.compile(r"cdninstagram|fbcdn|scontent|instagram")
+
+    def __init__(
+        self,
+        api_key: str,
+        cache_hours: int = 6,
+        max_concurrent: int = 8,
+        max_cache_entries: int = 512,
+        limit_per_host: int = 10,
+        cache_file: Optional[Path] = DEFAULT_CACHE_FILE,
+    ):
         """
         Initialize Instagram photo service
 
         Args:
             api_key: Scrape Creators API key
             cache_hours: Hours to cache Instagram data
+            max_concurrent: Maximum number of handles fetched at the same time
+            max_cache_entries: Maximum number of cached post lists (LRU evicted)
+            limit_per_host: Maximum open connections to the Scrape Creators API
+            cache_file: JSON file for persisting cached posts (None disables it)
         """
         self.api_key = api_key
         self.cache_hours = cache_hours
         self.base_url = "https://api.scrapecreators.com/v2/instagram/user/posts"
-        self.cache: Dict[str, tuple[datetime, List[InstagramPost]]] = {}
+        self.cache: "OrderedDict[str, tuple[datetime, List[InstagramPost]]]" = (
+            OrderedDict()
+        )
+        self._cache_limit = max_cache_entries
+        self.cache_file = cache_file
+        self._disk_cache_loaded = False
         self.session: Optional[aiohttp.ClientSession] = None
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._limit_per_host = limit_per_host
+        self._rate_limit_lock = asyncio.Lock()
+        self._last_request_time: Optional[float] = None
 
     async def __aenter__(self):
         """Async context manager entry"""
-        self.session = aiohttp.ClientSession()
+        await self._get_session()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit"""
-        if self.session:
+        await self.close()
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it on first use"""
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=self._limit_per_host,
+                ttl_dns_cache=600,
+                keepalive_timeout=75,
+                enable_cleanup_closed=True,
+            )
+            self.session = aiohttp.ClientSession(connector=connector)
+        return self.session
+
+    async def close(self) -> None:
+        """Close the shared HTTP session"""
+        if self.session and not self.session.closed:
             await self.session.close()
+        self.session = None
 
     async def get_recent_posts(
         self, instagram_handle: str, limit: int = 50, since_days: int = 30
@@ -73,15 +172,16 @@ class InstagramPhotoService:
             List of InstagramPost objects
         """
         # Check cache first
+        self._load_disk_cache()
+        now = datetime.now(timezone.utc)
         cache_key = f"{instagram_handle}_{limit}_{since_days}"
-        if cache_key in self.cache:
-            cached_time, cached_posts = self.cache[cache_key]
-            if datetime.now() - cached_time < timedelta(hours=self.cache_hours):
-                logger.info(
-                    f"Using cached Instagram data for @{instagram_handle} "
-                    f"({len(cached_posts)} posts)"
-                )
-                return cached_posts
+        cached_posts = self._get_cached_posts(cache_key, now)
+        if cached_posts is not None:
+            logger.info(
+                f"Using cached Instagram data for @{instagram_handle} "
+                f"({len(cached_posts)} posts)"
+            )
+            return cached_posts
 
         try:
             logger.info(f"Fetching Instagram posts for @{instagram_handle}...")
@@ -90,12 +190,14 @@ class InstagramPhotoService:
             handle_clean = instagram_handle.lstrip("@")
 
             # Fetch from Scrape Creators API
-            posts = await self._fetch_from_scrape_creators(
-                handle_clean, limit, since_days
-            )
+            async with self._semaphore:
+                posts = await self._fetch_from_scrape_creators(
+                    handle_clean, limit, since_days
+                )
 
             # Cache the results
-            self.cache[cache_key] = (datetime.now(), posts)
+            self._store_cached_posts(cache_key, posts, now)
+            self._save_disk_cache()
 
             logger.info(f"Fetched {len(posts)} Instagram posts for @{instagram_handle}")
             return posts
@@ -104,6 +206,114 @@ class InstagramPhotoService:
             logger.error(f"Error fetching Instagram posts for @{instagram_handle}: {e}")
             return []
 
+    def _get_cached_posts(
+        self, cache_key: str, now: datetime
+    ) -> Optional[List[InstagramPost]]:
+        """Return cached posts if present and not expired, evicting stale entries"""
+        entry = self.cache.get(cache_key)
+        if entry is None:
+            return None
+
+        cached_time, cached_posts = entry
+        if now - cached_time >= timedelta(hours=self.cache_hours):
+            del self.cache[cache_key]
+            return None
+
+        # Move to end (most recently used)
+        self.cache.move_to_end(cache_key)
+        return cached_posts
+
+    def _store_cached_posts(
+        self, cache_key: str, posts: List[InstagramPost], now: datetime
+    ) -> None:
+        """Cache posts for a key, evicting the least recently used entry if full"""
+        if cache_key in self.cache:
+            self.cache.move_to_end(cache_key)
+        self.cache[cache_key] = (now, posts)
+
+        if len(self.cache) > self._cache_limit:
+            self.cache.popitem(last=False)
+
+    def _load_disk_cache(self) -> None:
+        """Load persisted post lists into the in-memory cache (once per instance)"""
+        if self._disk_cache_loaded:
+            return
+        self._disk_cache_loaded = True
+
+        if not self.cache_file or not self.cache_file.exists():
+            return
+
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception as e:
+            logger.error(f"Failed to load Instagram cache: {e}")
+            return
+
+        for cache_key, entry in data.items():
+            try:
+                cached_time = datetime.fromisoformat(entry["cached_at"])
+                posts = []
+                for post in entry["posts"]:
+                    post["posted_at"] = datetime.fromisoformat(post["posted_at"])
+                    posts.append(InstagramPost(**post))
+            except (KeyError, TypeError, ValueError):
+                continue
+            self.cache[cache_key] = (cached_time, posts)
+
+        while len(self.cache) > self._cache_limit:
+            self.cache.popitem(last=False)
+
+        logger.info(f"Loaded Instagram cache with {len(self.cache)} entries")
+
+    def _save_disk_cache(self) -> None:
+        """Persist unexpired in-memory cache entries to the cache file"""
+        if not self.cache_file:
+            return
+
+        max_age = timedelta(hours=self.cache_hours)
+        now = datetime.now(timezone.utc)
+        data = {
+            cache_key: {
+                "cached_at": cached_time.isoformat(),
+                "posts": [
+                    {**asdict(post), "posted_at": post.posted_at.isoformat()}
+                    for post in posts
+                ],
+            }
+            for cache_key, (cached_time, posts) in self.cache.items()
+            if now - cached_time < max_age
+        }
+
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.cache_file, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+        except Exception as e:
+            logger.error(f"Failed to save Instagram cache: {e}")
+
+    async def get_recent_posts_bulk(
+        self, instagram_handles: List[str], limit: int = 50, since_days: int = 30
+    ) -> Dict[str, List[InstagramPost]]:
+        """
+        Get recent Instagram posts for several accounts concurrently
+
+        Args:
+            instagram_handles: Instagram handles to fetch
+            limit: Maximum number of posts to fetch per handle
+            since_days: Only fetch posts from last N days
+
+        Returns:
+            Dictionary mapping each handle to its list of InstagramPost objects
+        """
+        results = await asyncio.gather(
+            *(
+                self.get_recent_posts(handle, limit, since_days)
+                for handle in instagram_handles
+            )
+        )
+        return dict(zip(instagram_handles, results))
+
     async def _fetch_from_scrape_creators(
         self, handle: str, limit: int, since_days: int
     ) -> List[InstagramPost]:
@@ -118,11 +328,8 @@ class InstagramPhotoService:
         Returns:
             List of InstagramPost objects
         """
-        if not self.session:
-            async with aiohttp.ClientSession() as session:
-                return await self._make_api_request(session, handle, limit, since_days)
-        else:
-            return await self._make_api_request(self.session, handle, limit, since_days)
+        session = await self._get_session()
+        return await self._make_api_request(session, handle, limit, since_days)
 
     async def _make_api_request(
         self, session: aiohttp.ClientSession, handle: str, limit: int, since_days: int
@@ -130,7 +337,9 @@ class InstagramPhotoService:
         """Make the actual Scrape Creators API request"""
 
         # Calculate date threshold
-        date_threshold = datetime.now(timezone.utc) - timedelta(days=since_days)
+        now_utc = datetime.now(timezone.utc)
+        date_threshold = now_utc - timedelta(days=since_days)
+        threshold_ts = date_threshold.timestamp()
 
         headers = {"x-api-key": self.api_key}
 
@@ -151,54 +360,54 @@ class InstagramPhotoService:
                     f"Fetching page {pages_fetched + 1} for @{handle} (cursor: {cursor[:20] if cursor else 'None'}...)"
                 )
 
-                async with session.get(
-                    self.base_url, headers=headers, params=params, timeout=30
-                ) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        logger.error(
-                            f"Scrape Creators API error: HTTP {response.status} - {error_text}"
-                        )
-                        break
+                data = await self._fetch_page(session, headers, params)
+                if data is None:
+                    break
 
-                    data = await response.json()
+                # Extract posts from response
+                items = data.get("items", [])
+                if not items:
+                    logger.info("No more posts available")
+                    break
 
-                    # Extract posts from response
-                    items = data.get("items", [])
-                    if not items:
-                        logger.info("No more posts available")
-                        break
-
-                    logger.info(
-                        f"Retrieved {len(items)} posts from page {pages_fetched + 1}"
-                    )
+                logger.info(
+                    f"Retrieved {len(items)} posts from page {pages_fetched + 1}"
+                )
 
-                    # Convert and filter posts
-                    for item in items:
-                        post = self._convert_to_instagram_post(item, handle)
-                        if post and post.posted_at >= date_threshold:
-                            all_posts.append(post)
+                # Convert and filter posts, skipping old ones before conversion
+                for item in items:
+                    taken_at = item.get("taken_at")
+                    if taken_at and taken_at < threshold_ts:
+                        continue
 
-                        # Stop if we've hit the limit
-                        if len(all_posts) >= limit:
-                            break
+                    post = self._convert_to_instagram_post(item, handle, now_utc)
+                    if post and post.posted_at >= date_threshold:
+                        all_posts.append(post)
 
-                    # Check if there are more pages
-                    more_available = data.get("more_available", False)
-                    if not more_available:
-                        logger.info("No more pages available")
+                    # Stop if we've hit the limit
+                    if len(all_posts) >= limit:
                         break
 
-                    # Get next cursor for pagination
-                    cursor = data.get("next_cursor")
-                    if not cursor:
-                        logger.info("No next cursor available")
-                        break
+                # Posts are newest-first (pinned posts aside, which sit at the
+                # top), so an old last item means later pages are all too old
+                last_taken_at = items[-1].get("taken_at")
+                if last_taken_at and last_taken_at < threshold_ts:
+                    logger.info("Reached posts older than the lookback window")
+                    break
+
+                # Check if there are more pages
+                more_available = data.get("more_available", False)
+                if not more_available:
+                    logger.info("No more pages available")
+                    break
 
-                    pages_fetched += 1
+                # Get next cursor for pagination
+                cursor = data.get("next_cursor")
+                if not cursor:
+                    logger.info("No next cursor available")
+                    break
 
-                    # Rate limiting - be respectful
-                    await asyncio.sleep(0.5)
+                pages_fetched += 1
 
             logger.info(
                 f"Fetched {len(all_posts)} total posts for @{handle} "
@@ -206,6 +415,10 @@ class InstagramPhotoService:
             )
             return all_posts[:limit]
 
+        except aiohttp.ClientResponseError:
+            # Still rate limited after retries; let get_recent_posts log it and
+            # skip caching rather than returning a silently truncated list
+            raise
         except asyncio.TimeoutError:
             logger.error("Scrape Creators API request timeout")
             return all_posts
@@ -213,8 +426,71 @@ class InstagramPhotoService:
             logger.error(f"Error making Scrape Creators request: {e}")
             return all_posts
 
+    async def _wait_for_rate_limit(self) -> None:
+        """Wait until MIN_REQUEST_INTERVAL has passed since the last API request"""
+        async with self._rate_limit_lock:
+            loop = asyncio.get_running_loop()
+            if self._last_request_time is not None:
+                wait = self._last_request_time + MIN_REQUEST_INTERVAL - loop.time()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+            self._last_request_time = loop.time()
+
+    async def _fetch_page(
+        self, session: aiohttp.ClientSession, headers: Dict, params: Dict
+    ) -> Optional[Dict]:
+        """
+        Fetch one page of posts, retrying rate-limited and 5xx responses
+
+        Returns:
+            Parsed response body, or None on a non-retryable API error
+
+        Raises:
+            aiohttp.ClientResponseError: if the API is still rate limiting (or
+                failing) after API_RETRIES attempts
+        """
+        backoff = API_RETRY_BASE_DELAY
+        for attempt in range(1, API_RETRIES + 1):
+            await self._wait_for_rate_limit()
+
+            async with session.get(
+                self.base_url,
+                headers=headers,
+                params=params,
+                timeout=aiohttp.ClientTimeout(total=30),
+            ) as response:
+                if response.status == 200:
+                    return orjson.loads(await response.read())
+
+                error_text = await response.text()
+                if response.status not in API_RETRY_STATUS_CODES:
+                    logger.error(
+                        f"Scrape Creators API error: HTTP {response.status} - {error_text}"
+                    )
+                    return None
+
+                if attempt == API_RETRIES:
+                    logger.error(
+                        f"Scrape Creators API still failing after {API_RETRIES} "
+                        f"attempts: HTTP {response.status} - {error_text}"
+                    )
+                    response.raise_for_status()
+
+                # Honour the server's Retry-After (in seconds) when it sends one
+                retry_after = response.headers.get("Retry-After", "")
+                delay = float(retry_after) if retry_after.isdigit() else backoff
+
+            logger.warning(
+                f"Scrape Creators API returned HTTP {response.status} "
+                f"(attempt {attempt}/{API_RETRIES}) - retrying in {delay:.1f}s"
+            )
+            await asyncio.sleep(delay)
+            backoff *= 2
+
+        return None
+
     def _convert_to_instagram_post(
-        self, item: Dict, handle: str
+        self, item: Dict, handle: str, now_utc: Optional[datetime] = None
     ) -> Optional[InstagramPost]:
         """Convert Scrape Creators post data to InstagramPost object"""
         try:
@@ -252,7 +528,7 @@ class InstagramPhotoService:
                 posted_at = datetime.fromtimestamp(taken_at, tz=timezone.utc)
             else:
                 logger.warning(f"Post {post_id} missing timestamp, using current time")
-                posted_at = datetime.now(timezone.utc)
+                posted_at = now_utc or datetime.now(timezone.utc)
 
             # Extract engagement metrics
             likes = item.get("like_count", 0)
@@ -282,7 +558,15 @@ class InstagramPhotoService:
 
     def _extract_image_url(self, item: Dict) -> Optional[str]:
         """Extract the best quality image URL from post data"""
-        # Try direct image URL fields first
+        # Common case: image_versions2.candidates, first candidate is highest quality
+        try:
+            url = item["image_versions2"]["candidates"][0]["url"]
+        except (KeyError, IndexError, TypeError):
+            url = None
+        if url and isinstance(url, str):
+            return url
+
+        # Try direct image URL fields
         direct_fields = [
             "display_url",
             "image_url",
@@ -294,18 +578,6 @@ class InstagramPhotoService:
             if url and isinstance(url, str) and self._looks_like_image_url(url):
                 return url
 
-        # Try image_versions2.candidates (array of different resolutions)
-        image_versions = item.get("image_versions2", {})
-        if isinstance(image_versions, dict):
-            candidates = image_versions.get("candidates", [])
-            if isinstance(candidates, list) and candidates:
-                # First candidate is usually highest quality
-                first_candidate = candidates[0]
-                if isinstance(first_candidate, dict):
-                    url = first_candidate.get("url")
-                    if url and isinstance(url, str):
-                        return url
-
         # Try carousel_media for multi-image posts
         carousel_media = item.get("carousel_media", [])
         if isinstance(carousel_media, list) and carousel_media:
@@ -327,37 +599,25 @@ class InstagramPhotoService:
             return False
 
         # Check for image extensions
-        image_exts = (".jpg", ".jpeg", ".png", ".gif", ".webp")
-        if lower_url.endswith(image_exts):
+        if lower_url.endswith(self.IMAGE_EXTENSIONS):
             return True
 
         # Check for Instagram CDN indicators
-        cdn_indicators = [
-            "cdninstagram",
-            "fbcdn",
-            "scontent",
-            "instagram",
-        ]
-        return any(indicator in lower_url for indicator in cdn_indicators)
+        return self.CDN_INDICATOR_RE.search(lower_url) is not None
 
     def _find_image_url_recursive(self, data: Any) -> Optional[str]:
-        """Recursively search for a direct image URL"""
-        if isinstance(data, str):
-            if self._looks_like_image_url(data):
-                return data
-            return None
-
-        if isinstance(data, dict):
-            for value in data.values():
-                result = self._find_image_url_recursive(value)
-                if result:
-                    return result
-
-        if isinstance(data, list):
-            for item in data:
-                result = self._find_image_url_recursive(item)
-                if result:
-                    return result
+        """Depth-first search for a direct image URL (iterative, stops at first hit)"""
+        stack = [data]
+        while stack:
+            value = stack.pop()
+            if isinstance(value, str):
+                if self._looks_like_image_url(value):
+                    return value
+            elif isinstance(value, dict):
+                # Reversed so values are visited in their original order
+                stack.extend(reversed(value.values()))
+            elif isinstance(value, list):
+                stack.extend(reversed(value))
 
         return None
 
@@ -374,26 +634,17 @@ class InstagramPhotoService:
         Returns:
             Filtered list with is_tunnel_fit_candidate=True and confidence scores
         """
-        if keywords is None:
-            keywords = [
-                "tunnel",
-                "pregame",
-                "gameday",
-                "game day",
-                "arrival",
-                "fit",
-                "outfit",
-                "ootd",
-                "fashion",
-                "style",
-                "wearing",
-            ]
+        keyword_re, prefix_keywords = _compile_keyword_matcher(
+            TUNNEL_FIT_KEYWORDS if keywords is None else tuple(keywords)
+        )
 
         for post in posts:
             caption_lower = post.caption.lower()
 
-            # Count keyword matches
-            matches = sum(1 for keyword in keywords if keyword in caption_lower)
+            # Count distinct keywords present in the caption
+            matches = sum(keyword in caption_lower for keyword in prefix_keywords)
+            if keyword_re:
+                matches += len(set(keyword_re.findall(caption_lower)))
 
             # Calculate confidence based on keyword matches
             confidence = min(matches * 0.25, 1.0)  # 0.25 per keyword match, max 1.0
@@ -408,6 +659,7 @@ class InstagramPhotoService:
         return posts
 
     @staticmethod
+    @functools.lru_cache(maxsize=10000)
     def get_image_hash(image_url: str) -> str:
         """
         Generate a hash for image URL for deduplication
@@ -416,6 +668,6 @@ class InstagramPhotoService:
             image_url: Image URL
 
         Returns:
-            MD5 hash of the URL
+            128-bit BLAKE2b hex digest of the URL (same length as MD5)
         """
-        return hashlib.md5(image_url.encode()).hexdigest()
+        return hashlib.blake2b(image_url.encode(), digest_size=16).hexdigest()
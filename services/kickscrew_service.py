@@ -6,19 +6,114 @@ Rebuilt from historical implementation with enhancements for smart colorway inte
 
 import logging
 import asyncio
+import functools
+import re
+import time
 import urllib.parse
-from datetime import date, datetime
+from datetime import date
 from typing import Optional
 from dataclasses import dataclass
 from utils.branded_types import KicksCrewUrl, SearchUrl, Price
+from services.kixstats_service import wait_for_kixstats_rate_limit
 import aiohttp
+import orjson
 from playwright.async_api import async_playwright
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 from bs4 import BeautifulSoup
 
 logger = logging.getLogger(__name__)
 
+# Realistic headers applied to every KicksCrew browser page
+BROWSER_EXTRA_HEADERS = {"Accept-Language": "en-US,en;q=0.9"}
+
+# Desktop viewport so KicksCrew serves its standard product layout
+BROWSER_VIEWPORT = {"width": 1366, "height": 768}
+
+# Headers for plain HTTP requests to KixStats (the UA is shared with the browser)
+HTTP_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36"
+}
+
+# First KicksCrew link inside a KixStats store box
+STORE_BOX_KICKSCREW_LINK_SELECTOR = "div.store-box a[href*='kickscrew']"
+
+# Element that signals the product page has rendered its price
+PRICE_READY_SELECTOR = "span:has-text('$')"
+
+# Price fallbacks in priority order: near the title, price classes, any span.
+# Plain CSS so FIND_PRICE_TEXT_JS can run them all in the page; the script's
+# "$" check stands in for Playwright's :has-text('$').
+PRICE_FALLBACK_SELECTORS = ("h1 ~ * span", ".price span", "[data-price] span", "span")
+
+# Returns the first span text (by selector priority) that contains a price
+FIND_PRICE_TEXT_JS = """
+([selectors, pattern]) => {
+    const priceRe = new RegExp(pattern);
+    for (const selector of selectors) {
+        for (const el of document.querySelectorAll(selector)) {
+            const text = (el.textContent || "").trim();
+            if (text.includes("$") && priceRe.test(text)) {
+                return text;
+            }
+        }
+    }
+    return null;
+}
+"""
+
+# Structured product data embedded in the page
+JSON_LD_SELECTOR = 'script[type="application/ld+json"]'
+
+# "$123.45", "$1,234.56" or "USD 123.45" in one pass
+PRICE_RE = re.compile(r"(?:\$|USD\s*)(\d{1,4}(?:,\d{3})*(?:\.\d{2})?)")
+
+# Release date mentions in page text; groups are listed in priority order
+RELEASE_DATE_RE = re.compile(
+    r"Release Date:?\s*(?P<release_date>\d{1,2}[/-]\d{1,2}[/-]\d{4})"
+    r"|Released:?\s*(?P<released>\d{1,2}[/-]\d{1,2}[/-]\d{4})"
+    r"|(?P<iso>\d{4}-\d{2}-\d{2})",
+    re.IGNORECASE,
+)
+RELEASE_DATE_GROUPS = ("release_date", "released", "iso")
+DATE_SEPARATOR_RE = re.compile(r"[/-]")
+
+# Failed lookups are retried after this long; successful ones are kept for the run
+NEGATIVE_CACHE_TTL = 600  # seconds
+
+# Chromium flags that keep long-lived headless browsers stable in containers
+BROWSER_LAUNCH_ARGS = ["--disable-dev-shm-usage", "--disable-gpu"]
+
+# Pooled pages are recycled after this many navigations to bound memory growth
+MAX_PAGE_USES = 50
+
+# Resources the scraper never reads; aborting them cuts page load time and memory
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media", "stylesheet"})
+BLOCKED_URL_RE = re.compile(
+    r"google-analytics|googletagmanager|doubleclick|facebook|hotjar"
+)
+
+# Minimum spacing between KicksCrew page loads to avoid being blocked
+MIN_REQUEST_INTERVAL = 3.0  # seconds
+
+
+@functools.lru_cache(maxsize=4096)
+def _quote(value: str) -> str:
+    """URL-quote a search term; batch runs repeat the same brands and models"""
+    return urllib.parse.quote(value)
+
+
+async def _block_heavy_assets(route) -> None:
+    """Playwright route handler that aborts images, fonts, media and trackers"""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or BLOCKED_URL_RE.search(
+        request.url
+    ):
+        await route.abort()
+    else:
+        await route.continue_()
 
-@dataclass
+
+@dataclass(slots=True)
 class KicksCrewShoeData:
     """Shoe data extracted from KicksCrew"""
 
@@ -31,22 +126,71 @@ class KicksCrewShoeData:
 class KicksCrewService:
     """Service for extracting shoe data from KicksCrew.com using Playwright"""
 
-    def __init__(self, request_timeout: int = 30):
+    def __init__(self, request_timeout: int = 30, max_pages: int = 4):
         self.base_url = "https://www.kickscrew.com"
         self.playwright = None
         self.browser = None
+        self.context = None
+        self._page_pool: Optional[asyncio.Queue] = None
+        self._page_slots: Optional[asyncio.Semaphore] = None
+        self._max_pages = max_pages
+        self._page_uses: dict = {}
+        self._shoe_details_cache: dict[
+            str, tuple[Optional[KicksCrewShoeData], float]
+        ] = {}
+        self._kickscrew_url_cache: dict[str, tuple[Optional[str], float]] = {}
+        self._rate_limit_locks: dict[str, asyncio.Lock] = {}
+        self._last_request_times: dict[str, float] = {}
+        self._aiohttp_session: Optional[aiohttp.ClientSession] = None
+        self._browser_lock = asyncio.Lock()
         self.request_timeout = request_timeout * 1000  # Playwright uses milliseconds
 
     async def __aenter__(self):
-        self.playwright = await async_playwright().start()
-        self.browser = await self.playwright.chromium.launch(headless=True)
+        await self._start_browser()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def _start_browser(self) -> None:
+        """Launch the shared browser and context once; later calls are no-ops"""
+        async with self._browser_lock:
+            if self.browser:
+                return
+
+            self.playwright = await async_playwright().start()
+            self.browser = await self.playwright.chromium.launch(
+                headless=True, args=BROWSER_LAUNCH_ARGS
+            )
+            self.context = await self.browser.new_context(
+                extra_http_headers=BROWSER_EXTRA_HEADERS,
+                user_agent=HTTP_HEADERS["User-Agent"],
+                viewport=BROWSER_VIEWPORT,
+            )
+            await self.context.route("**/*", _block_heavy_assets)
+            self._page_pool = asyncio.Queue()
+            # One slot per open page; a slot freed by a dropped page lets a
+            # waiting scrape open a replacement
+            self._page_slots = asyncio.Semaphore(self._max_pages)
+            self._page_uses = {}
+
+    async def close(self) -> None:
+        """Close the browser and HTTP session (call when not using `async with`)"""
+        if self._aiohttp_session and not self._aiohttp_session.closed:
+            await self._aiohttp_session.close()
+        self._aiohttp_session = None
+        if self.context:
+            await self.context.close()
+            self.context = None
+        self._page_pool = None
+        self._page_slots = None
+        self._page_uses = {}
         if self.browser:
             await self.browser.close()
+            self.browser = None
         if self.playwright:
             await self.playwright.stop()
+            self.playwright = None
 
     async def get_shoe_details_from_kixstats_url(
         self, kixstats_shoe_url: str
@@ -90,20 +234,22 @@ class KicksCrewService:
         Returns:
             KicksCrewShoeData object or None if not found
         """
+        cached = self._get_memoized(self._shoe_details_cache, kickscrew_url)
+        if cached is not None:
+            return cached[0]
+
+        shoe_data = await self._fetch_shoe_details(kickscrew_url)
+        self._memoize(self._shoe_details_cache, kickscrew_url, shoe_data)
+        return shoe_data
+
+    async def _fetch_shoe_details(
+        self, kickscrew_url: str
+    ) -> Optional[KicksCrewShoeData]:
+        """Scrape a KicksCrew product page, bypassing the memo table"""
         try:
-            if not self.browser:
-                async with async_playwright() as playwright:
-                    browser = await playwright.chromium.launch(headless=True)
-                    try:
-                        return await self._scrape_kickscrew_with_browser(
-                            browser, kickscrew_url
-                        )
-                    finally:
-                        await browser.close()
-            else:
-                return await self._scrape_kickscrew_with_browser(
-                    self.browser, kickscrew_url
-                )
+            # Outside `async with`, launch once and reuse for later calls
+            await self._start_browser()
+            return await self._scrape_kickscrew_with_pool(kickscrew_url)
 
         except Exception as e:
             logger.error(
@@ -111,15 +257,58 @@ class KicksCrewService:
             )
             return None
 
+    async def get_shoe_details_bulk(
+        self, kickscrew_urls: list[str], concurrency: int = 4
+    ) -> list[Optional[KicksCrewShoeData]]:
+        """
+        Get shoe details for several KicksCrew URLs concurrently
+
+        Page loads are still spaced by MIN_REQUEST_INTERVAL; concurrency only
+        lets slow pages overlap instead of queueing behind each other.
+
+        Args:
+            kickscrew_urls: Direct URLs to KicksCrew product pages
+            concurrency: Maximum number of pages loading at once
+
+        Returns:
+            List of KicksCrewShoeData (or None) in the same order as the URLs
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(url: str) -> Optional[KicksCrewShoeData]:
+            async with semaphore:
+                return await self.get_shoe_details_from_kickscrew_url(url)
+
+        return list(await asyncio.gather(*(fetch(url) for url in kickscrew_urls)))
+
+    def _get_http_session(self) -> aiohttp.ClientSession:
+        """Get the shared aiohttp session for KixStats, creating it on first use"""
+        if self._aiohttp_session is None or self._aiohttp_session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=20,
+                limit_per_host=10,
+                ttl_dns_cache=600,
+                enable_cleanup_closed=True,
+            )
+            self._aiohttp_session = aiohttp.ClientSession(
+                connector=connector, headers=HTTP_HEADERS
+            )
+        return self._aiohttp_session
+
     async def _extract_kickscrew_url_from_kixstats(
         self, kixstats_shoe_url: str
     ) -> Optional[str]:
         """Extract KicksCrew URL from KixStats shoe detail page"""
+        cached = self._get_memoized(self._kickscrew_url_cache, kixstats_shoe_url)
+        if cached is not None:
+            return cached[0]
 
         try:
             # Use aiohttp for KixStats - it works fine and is much faster
-            async with aiohttp.ClientSession() as session:
-                return await self._extract_with_session(session, kixstats_shoe_url)
+            session = self._get_http_session()
+            kickscrew_url = await self._extract_with_session(session, kixstats_shoe_url)
+            self._memoize(self._kickscrew_url_cache, kixstats_shoe_url, kickscrew_url)
+            return kickscrew_url
 
         except Exception as e:
             logger.error(
@@ -127,148 +316,195 @@ class KicksCrewService:
             )
             return None
 
+    def _get_memoized(self, cache: dict, key: str) -> Optional[tuple]:
+        """Return a (value,) tuple for a live memo entry, or None on a miss"""
+        entry = cache.get(key)
+        if entry is None:
+            return None
+
+        value, expires_at = entry
+        if time.monotonic() >= expires_at:
+            del cache[key]
+            return None
+        return (value,)
+
+    def _memoize(self, cache: dict, key: str, value) -> None:
+        """Store a lookup result; None results expire after NEGATIVE_CACHE_TTL"""
+        expires_at = (
+            float("inf") if value is not None else time.monotonic() + NEGATIVE_CACHE_TTL
+        )
+        cache[key] = (value, expires_at)
+
     async def _extract_with_session(
         self, session: aiohttp.ClientSession, kixstats_shoe_url: str
     ) -> Optional[str]:
         """Extract KicksCrew URL from KixStats using aiohttp (fast and works)"""
 
-        # Small delay to be respectful
-        await asyncio.sleep(1)
+        # Shares one limiter with KixStatsService; only delays back-to-back fetches
+        await wait_for_kixstats_rate_limit()
 
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36"
-        }
-
-        async with session.get(kixstats_shoe_url, headers=headers) as response:
+        async with session.get(kixstats_shoe_url) as response:
             if response.status != 200:
                 logger.warning(
                     f"Failed to fetch KixStats shoe page: {kixstats_shoe_url}"
                 )
                 return None
 
-            html = await response.text()
-            soup = BeautifulSoup(html, "html.parser")
+            body = await response.read()
+            encoding = response.charset
 
-            # Find KicksCrew link in store boxes
-            store_boxes = soup.find_all("div", class_="store-box")
-            for box in store_boxes:
-                kickscrew_links = box.find_all(
-                    "a", href=lambda href: href and "kickscrew" in href
-                )
-                if kickscrew_links:
-                    kickscrew_url = kickscrew_links[0]["href"]
-                    logger.info(f"Found KicksCrew URL: {kickscrew_url}")
-                    return kickscrew_url
+        # Parse off the event loop so concurrent page loads keep progressing
+        kickscrew_url = await asyncio.to_thread(
+            self._find_kickscrew_link, body, encoding
+        )
+        if kickscrew_url:
+            logger.info(f"Found KicksCrew URL: {kickscrew_url}")
+            return kickscrew_url
 
-            logger.debug(f"No KicksCrew link found in {kixstats_shoe_url}")
-            return None
+        logger.debug(f"No KicksCrew link found in {kixstats_shoe_url}")
+        return None
 
-    async def _scrape_kickscrew_with_browser(
-        self, browser, kickscrew_url: str
+    def _find_kickscrew_link(
+        self, body: bytes, encoding: Optional[str] = None
+    ) -> Optional[str]:
+        """Return the first KicksCrew link in a KixStats page's store boxes"""
+        # Use the HTTP header charset when there is one; otherwise lxml falls
+        # back to the page's meta tag
+        soup = BeautifulSoup(body, "lxml", from_encoding=encoding)
+        link = soup.select_one(STORE_BOX_KICKSCREW_LINK_SELECTOR)
+        return link["href"] if link else None
+
+    async def _scrape_kickscrew_with_pool(
+        self, kickscrew_url: str
     ) -> Optional[KicksCrewShoeData]:
-        """Scrape KicksCrew data using provided browser"""
+        """Scrape KicksCrew data using a pooled page from the shared browser context"""
+
+        # Space out page loads to avoid being blocked
+        await self._wait_for_rate_limit()
+
+        page = await self._acquire_page()
+        try:
+            return await self._scrape_kickscrew_page(page, kickscrew_url)
+        finally:
+            await self._release_page(page)
+
+    async def _wait_for_rate_limit(
+        self, site: str = "kickscrew", interval: float = MIN_REQUEST_INTERVAL
+    ) -> None:
+        """Wait until `interval` seconds have passed since the last request to a site"""
+        lock = self._rate_limit_locks.setdefault(site, asyncio.Lock())
+        async with lock:
+            loop = asyncio.get_running_loop()
+            last = self._last_request_times.get(site)
+            if last is not None:
+                wait = last + interval - loop.time()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+            self._last_request_times[site] = loop.time()
+
+    async def _acquire_page(self):
+        """Take an idle page from the pool, opening a new one while under the cap"""
+        await self._page_slots.acquire()
+        try:
+            if not self._page_pool.empty():
+                return self._page_pool.get_nowait()
+            return await self.context.new_page()
+        except BaseException:
+            self._page_slots.release()
+            raise
 
-        # Add respectful delay to avoid being blocked
-        await asyncio.sleep(3)
+    async def _release_page(self, page) -> None:
+        """Return a page to the pool, dropping it if closed or worn out"""
+        try:
+            uses = self._page_uses.get(page, 0) + 1
+            if page.is_closed() or uses >= MAX_PAGE_USES:
+                self._page_uses.pop(page, None)
+                if not page.is_closed():
+                    try:
+                        await page.close()
+                    except Exception as e:
+                        logger.debug(f"Failed to close recycled page: {e}")
+            else:
+                self._page_uses[page] = uses
+                self._page_pool.put_nowait(page)
+        finally:
+            self._page_slots.release()
 
-        page = await browser.new_page()
+    async def _scrape_kickscrew_page(
+        self, page, kickscrew_url: str
+    ) -> Optional[KicksCrewShoeData]:
+        """Navigate a page to a KicksCrew product URL and extract its data"""
         try:
             await self._setup_page_and_navigate(page, kickscrew_url)
-            retail_price = await self._extract_price_with_playwright(page)
-            html = await page.content()
-            shoe_data = self._parse_kickscrew_page(html, kickscrew_url)
 
-            # Override price with Playwright-extracted price if found
-            if retail_price and shoe_data:
-                shoe_data.retail_price = retail_price
+            # JSON-LD blocks are a few KB; only serialize the full DOM if they
+            # don't carry everything we need
+            scripts = await page.locator(JSON_LD_SELECTOR).all_text_contents()
+            shoe_data = self._parse_json_ld_product(scripts, kickscrew_url)
+            if not shoe_data:
+                html = await page.content()
+                shoe_data = await asyncio.to_thread(
+                    self._parse_kickscrew_page, html, kickscrew_url
+                )
+
+            # Fall back to the DOM selector walk only if JSON-LD had no price
+            if shoe_data and not shoe_data.retail_price:
+                shoe_data.retail_price = await self._extract_price_with_playwright(page)
 
             return shoe_data
 
         except Exception as e:
             logger.warning(f"Failed to fetch KicksCrew page: {kickscrew_url} - {e}")
             return None
-        finally:
-            await page.close()
 
     async def _setup_page_and_navigate(self, page, kickscrew_url: str) -> None:
-        """Setup page headers and navigate to URL"""
+        """Navigate to URL and wait for the page to load"""
         try:
-            # Set realistic headers
-            await page.set_extra_http_headers({"Accept-Language": "en-US,en;q=0.9"})
-
             logger.info(f"Fetching KicksCrew page: {kickscrew_url}")
-            await page.goto(kickscrew_url, timeout=self.request_timeout)
+            await page.goto(
+                kickscrew_url,
+                timeout=self.request_timeout,
+                wait_until="domcontentloaded",
+            )
 
-            # Wait for page content to load
-            logger.info("Waiting 10 seconds for page to load...")
-            await asyncio.sleep(10)
+            # Wait for the client-rendered price instead of a fixed delay
+            try:
+                await page.wait_for_selector(
+                    PRICE_READY_SELECTOR, timeout=self.request_timeout
+                )
+            except PlaywrightTimeoutError:
+                logger.debug(f"Timed out waiting for price on {kickscrew_url}")
 
         except Exception as e:
             logger.error(f"Failed to navigate to KicksCrew page: {e}")
             raise
 
     async def _extract_price_with_playwright(self, page) -> Optional[Price]:
-        """Extract price using multiple Playwright selector strategies"""
-        price_selectors = self._get_price_selectors()
+        """Extract price by running the selector fallbacks in one browser call"""
+        try:
+            text = await page.evaluate(
+                FIND_PRICE_TEXT_JS,
+                [list(PRICE_FALLBACK_SELECTORS), PRICE_RE.pattern],
+            )
+        except Exception as e:
+            logger.debug(f"Price selector evaluation failed: {e}")
+            return None
 
-        for selector in price_selectors:
-            price = await self._try_price_selector(page, selector)
+        if text:
+            price = self._extract_price_from_text(text.strip())
             if price:
+                logger.info(f"Found price on page: {price}")
                 return price
 
         logger.debug("No price found with any selector")
         return None
 
-    def _get_price_selectors(self) -> list[str]:
-        """Get list of price selectors in priority order"""
-        return [
-            "h1 ~ * span:has-text('$')",  # Span with $ near the title
-            ".price span:has-text('$')",  # Price class with span
-            "[data-price] span:has-text('$')",  # Data price attribute
-            "span:has-text('$'):near(h1)",  # Span with $ near h1
-            "span:has-text('$')",  # Any span with $
-        ]
-
-    async def _try_price_selector(self, page, selector: str) -> Optional[Price]:
-        """Try a single price selector and return price if found"""
-        try:
-            elements = await page.query_selector_all(selector)
-            for element in elements:
-                price = await self._extract_price_from_element(element)
-                if price:
-                    logger.info(f"Found price using selector '{selector}': {price}")
-                    return price
-        except Exception as e:
-            logger.debug(f"Selector '{selector}' failed: {e}")
-
-        return None
-
-    async def _extract_price_from_element(self, element) -> Optional[Price]:
-        """Extract price from a single page element"""
-        try:
-            text = await element.text_content()
-            if text and "$" in text:
-                return self._extract_price_from_text(text.strip())
-        except Exception as e:
-            logger.debug(f"Failed to extract text from element: {e}")
-
-        return None
-
     def _extract_price_from_text(self, text: str) -> Optional[Price]:
         """Extract price from text using regex"""
-        import re
-
-        # Look for patterns like $123.45, $123, etc.
-        price_patterns = [
-            r"\$(\d{1,4}(?:,\d{3})*(?:\.\d{2})?)",  # $123.45, $1,234.56
-            r"USD\s*(\d{1,4}(?:,\d{3})*(?:\.\d{2})?)",  # USD 123.45
-        ]
-
-        for pattern in price_patterns:
-            match = re.search(pattern, text)
-            if match:
-                price_value = match.group(1).replace(",", "")
-                return Price(f"${price_value}")
+        match = PRICE_RE.search(text)
+        if match:
+            price_value = match.group(1).replace(",", "")
+            return Price(f"${price_value}")
 
         return None
 
@@ -278,18 +514,28 @@ class KicksCrewService:
         """Parse KicksCrew page HTML for product information"""
 
         try:
-            soup = BeautifulSoup(html, "html.parser")
+            soup = BeautifulSoup(html, "lxml")
 
             # Extract product name
             product_name = self._extract_product_name(soup)
 
-            # Extract release date
-            release_date = self._extract_release_date(soup)
+            scripts = [
+                script.string or ""
+                for script in soup.find_all("script", type="application/ld+json")
+            ]
+            product = self._find_json_ld_product(scripts)
+
+            # Structured release date first; the full-text scan is the fallback
+            release_date = (
+                self._parse_iso_date(product.get("releaseDate")) if product else None
+            ) or self._extract_release_date(soup)
+
+            # Structured price; None means the caller falls back to Playwright
+            retail_price = self._extract_json_ld_price(product)
 
-            # Note: price will be overridden by Playwright extraction
             return KicksCrewShoeData(
                 release_date=release_date,
-                retail_price=None,  # Will be set by Playwright
+                retail_price=retail_price,
                 kickscrew_url=KicksCrewUrl(kickscrew_url),
                 product_name=product_name,
             )
@@ -298,6 +544,72 @@ class KicksCrewService:
             logger.error(f"Error parsing KicksCrew page: {e}")
             return None
 
+    def _parse_json_ld_product(
+        self, scripts: list[str], kickscrew_url: str
+    ) -> Optional[KicksCrewShoeData]:
+        """Build shoe data from JSON-LD alone
+
+        Returns None unless the Product block has both a name and a parseable
+        release date, so the caller knows to fall back to the full page.
+        """
+        product = self._find_json_ld_product(scripts)
+        if not product:
+            return None
+
+        product_name = product.get("name")
+        release_date = self._parse_iso_date(product.get("releaseDate"))
+        if not product_name or not release_date:
+            return None
+
+        return KicksCrewShoeData(
+            release_date=release_date,
+            retail_price=self._extract_json_ld_price(product),
+            kickscrew_url=KicksCrewUrl(kickscrew_url),
+            product_name=str(product_name).strip(),
+        )
+
+    def _find_json_ld_product(self, scripts: list[str]) -> Optional[dict]:
+        """Return the first schema.org Product object from JSON-LD script texts"""
+        for script in scripts:
+            try:
+                data = orjson.loads(script)
+            except orjson.JSONDecodeError:
+                continue
+
+            items = data if isinstance(data, list) else [data]
+            for item in items:
+                if isinstance(item, dict) and item.get("@type") == "Product":
+                    return item
+
+        return None
+
+    def _extract_json_ld_price(self, product: Optional[dict]) -> Optional[Price]:
+        """Extract USD price from a JSON-LD Product offers block, if present"""
+        if not product:
+            return None
+
+        offers = product.get("offers")
+        offers = offers if isinstance(offers, list) else [offers]
+        for offer in offers:
+            if not isinstance(offer, dict):
+                continue
+            if offer.get("priceCurrency", "USD") != "USD":
+                continue
+            price_value = offer.get("price") or offer.get("lowPrice")
+            if price_value:
+                return Price(f"${price_value}")
+
+        return None
+
+    def _parse_iso_date(self, value) -> Optional[date]:
+        """Parse the date part of an ISO 8601 string, returning None on failure"""
+        if not isinstance(value, str):
+            return None
+        try:
+            return date.fromisoformat(value[:10])
+        except ValueError:
+            return None
+
     def _extract_product_name(self, soup: BeautifulSoup) -> str:
         """Extract product name from page"""
         selectors = ["h1", ".product-title", ".title", "title"]
@@ -311,35 +623,46 @@ class KicksCrewService:
 
     def _extract_release_date(self, soup: BeautifulSoup) -> Optional[date]:
         """Extract release date from page"""
-        import re
+        # Microdata is cheap to check and avoids flattening the whole tree
+        element = soup.select_one('[itemprop="releaseDate"]')
+        if element:
+            release_date = self._parse_iso_date(
+                element.get("content")
+                or element.get("datetime")
+                or element.get_text(strip=True)
+            )
+            if release_date:
+                return release_date
 
         # Look for release date patterns in text
         text_content = soup.get_text()
-        date_patterns = [
-            r"Release Date:?\s*(\d{1,2}[/-]\d{1,2}[/-]\d{4})",
-            r"Released:?\s*(\d{1,2}[/-]\d{1,2}[/-]\d{4})",
-            r"(\d{4}-\d{2}-\d{2})",  # ISO format
-        ]
-
-        for pattern in date_patterns:
-            match = re.search(pattern, text_content, re.IGNORECASE)
-            if match:
-                try:
-                    date_str = match.group(1)
-                    # Try to parse the date
-                    if "/" in date_str:
-                        parsed_date = datetime.strptime(date_str, "%m/%d/%Y").date()
-                    elif "-" in date_str and len(date_str) == 10:
-                        parsed_date = datetime.strptime(date_str, "%Y-%m-%d").date()
-                    else:
-                        continue
 
+        # One scan, keeping the first match of each kind
+        first_matches = {}
+        for match in RELEASE_DATE_RE.finditer(text_content):
+            first_matches.setdefault(match.lastgroup, match.group(match.lastgroup))
+
+        for group in RELEASE_DATE_GROUPS:
+            date_str = first_matches.get(group)
+            if date_str:
+                parsed_date = self._parse_matched_date(group, date_str)
+                if parsed_date:
                     return parsed_date
-                except ValueError:
-                    continue
 
         return None
 
+    def _parse_matched_date(self, group: str, date_str: str) -> Optional[date]:
+        """Parse a RELEASE_DATE_RE match; the regex has already fixed its shape"""
+        if group == "iso":
+            return self._parse_iso_date(date_str)
+
+        # M/D/YYYY (or M-D-YYYY); only out-of-range values can fail here
+        month, day, year = map(int, DATE_SEPARATOR_RE.split(date_str))
+        try:
+            return date(year, month, day)
+        except ValueError:
+            return None
+
     def build_search_url(self, brand: str, model: str, colorway: str = "") -> SearchUrl:
         """
         Build KicksCrew search URL using shoe details
@@ -350,15 +673,15 @@ class KicksCrewService:
             search_terms.append(colorway)
 
         query = " ".join(search_terms)
-        encoded_query = urllib.parse.quote(query)
+        encoded_query = _quote(query)
         return SearchUrl(f"{self.base_url}/search?q={encoded_query}")
 
     def build_goat_search_url(self, shoe_name: str) -> SearchUrl:
         """Build GOAT search URL from shoe name"""
-        query = urllib.parse.quote(shoe_name)
+        query = _quote(shoe_name)
         return SearchUrl(f"https://www.goat.com/search?query={query}")
 
     def build_stockx_search_url(self, shoe_name: str) -> SearchUrl:
         """Build StockX search URL from shoe name"""
-        query = urllib.parse.quote(shoe_name)
+        query = _quote(shoe_name)
         return SearchUrl(f"https://stockx.com/search?s={query}")
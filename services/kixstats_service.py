@@ -5,19 +5,49 @@ Web scraping service for extracting game-by-game shoe data from KixStats.com
 
 import logging
 import asyncio
+import hashlib
 import json
-from datetime import date, datetime
-from typing import List, Optional
-from dataclasses import dataclass
+import time
+from datetime import date
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from dataclasses import dataclass, replace
+from pathlib import Path
 import aiohttp
 from bs4 import BeautifulSoup
 
-from utils.player_game_logs import PlayerGameLogService
+from services.preseason_schedule_service import PreseasonScheduleService
+from utils.player_game_logs import PlayerGameLogService, get_player_recent_game
+from utils.roster_cache import lookup_player_team
 
 logger = logging.getLogger(__name__)
 
-
-@dataclass
+# Raw player pages kept between runs; game history barely changes within hours
+HTML_CACHE_DIR = Path(__file__).parent.parent / "config" / "kixstats_html_cache"
+HTML_CACHE_TTL = 3 * 60 * 60  # seconds
+
+# Known player names (lowercased) to verified KixStats IDs
+PLAYER_ID_MAP = {
+    "caitlin clark": "caitlin-clark-44",
+    "paige bueckers": "paige-bueckers-19",
+    "aja wilson": "aja-wilson",
+    "a'ja wilson": "aja-wilson",  # Handle apostrophe variation
+    "angel reese": "angel-reese-73",
+    "cameron brink": "cameron-brink-41",
+    "napheesa collier": "napheesa-collier",
+}
+
+# Minimum spacing between kixstats.com fetches, shared by every service that hits
+# the site (KixStatsService game tables and KicksCrewService shoe-page lookups)
+MIN_REQUEST_INTERVAL = 2.0  # seconds
+_rate_limit_lock: Optional[asyncio.Lock] = None
+_rate_limit_loop: Optional[asyncio.AbstractEventLoop] = None
+_last_request_time: Optional[float] = None
+
+# Maximum opponent lookups in flight while parsing one player's games table
+OPPONENT_RESOLUTION_CONCURRENCY = 10
+
+
+@dataclass(slots=True, frozen=True)
 class GameShoeData:
     """Game shoe data extracted from KixStats"""
 
@@ -35,7 +65,96 @@ class GameShoeData:
     opponent: str = "Unknown"  # Team opponent for this game
 
 
-async def resolve_shoe_opponent(game_date: date, player_name: str) -> str:
+async def wait_for_kixstats_rate_limit() -> None:
+    """Wait until MIN_REQUEST_INTERVAL has passed since the last kixstats.com fetch"""
+    global _rate_limit_lock, _rate_limit_loop, _last_request_time
+
+    # Created on first use (and per event loop) so it is never bound to a
+    # loop that has already been closed by an earlier asyncio.run()
+    loop = asyncio.get_running_loop()
+    if _rate_limit_lock is None or _rate_limit_loop is not loop:
+        _rate_limit_lock = asyncio.Lock()
+        _rate_limit_loop = loop
+
+    async with _rate_limit_lock:
+        if _last_request_time is not None:
+            wait = _last_request_time + MIN_REQUEST_INTERVAL - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+        _last_request_time = time.monotonic()
+
+
+def _parse_stat_cell(cell) -> int:
+    """Parse an integer stat from a games table cell's span, defaulting to 0"""
+    span = cell.find("span")
+    if span:
+        text = span.get_text(strip=True)
+        try:
+            return int(text)
+        except ValueError:
+            return 0
+    return 0
+
+
+def _shared_task(
+    cache: Dict[Tuple, asyncio.Future],
+    key: Tuple,
+    fetch: Callable[[], Awaitable[Any]],
+) -> asyncio.Future:
+    """
+    Return the shared task for key, starting the fetch on first use
+
+    Concurrent callers with the same key await the same task, so each
+    fetch runs once per cache.
+    """
+    task = cache.get(key)
+    if task is None:
+        task = asyncio.ensure_future(fetch())
+        cache[key] = task
+    return task
+
+
+async def _fetch_opponents_by_date(player_name: str, season: int) -> Dict[date, str]:
+    """Fetch a player's season game log as a game date -> opponent mapping"""
+    game_stats_list = await PlayerGameLogService().get_player_game_stats(
+        player_name, season
+    )
+    # Reversed so the first game on a date wins, as the old linear scan did
+    return {
+        game_stat.date: game_stat.opponent for game_stat in reversed(game_stats_list)
+    }
+
+
+async def _fetch_player_preseason(player_name: str, season: int):
+    """
+    Look up the player's team and its preseason dates
+
+    Returns:
+        (team_name, preseason_service, team_dates); team_dates is empty when the
+        team is unknown, has no preseason games, or the lookup failed
+    """
+    try:
+        # The roster lookup reads a JSON file, so keep it off the event loop
+        team_name = await asyncio.to_thread(lookup_player_team, player_name)
+        if not team_name:
+            return None, None, []
+
+        async with PreseasonScheduleService() as preseason_service:
+            team_dates = await preseason_service.get_team_preseason_dates(
+                team_name, season
+            )
+        return team_name, preseason_service, team_dates
+
+    except Exception as e:
+        logger.debug(f"Error fetching preseason dates for {player_name}: {e}")
+        return None, None, []
+
+
+async def resolve_shoe_opponent(
+    game_date: date,
+    player_name: str,
+    season_cache: Optional[Dict[Tuple, asyncio.Future]] = None,
+) -> str:
     """
     Resolve opponent using proven cross-reference logic from milestone date resolver:
     1. Exact date match in regular season games (SportDataverse)
@@ -45,62 +164,64 @@ async def resolve_shoe_opponent(game_date: date, player_name: str) -> str:
     Args:
         game_date: Date of the game to look up
         player_name: Player name (e.g., "Caitlin Clark")
+        season_cache: Optional dict shared across calls so each season's game
+            log and preseason schedule is fetched only once
 
     Returns:
         Opponent team name from actual game data
     """
+    if season_cache is None:
+        season_cache = {}
+
     try:
-        # Strategy 1: Check for exact date match first
-        game_log_service = PlayerGameLogService()
         # Use the game date's year to query the correct season
         season = game_date.year
-        game_stats_list = await game_log_service.get_player_game_stats(
-            player_name, season
+
+        # Strategy 1: Check for exact date match first
+        opponents_by_date = await _shared_task(
+            season_cache,
+            ("game_stats", player_name, season),
+            lambda: _fetch_opponents_by_date(player_name, season),
         )
 
         # Find exact match in regular season
-        for game_stat in game_stats_list:
-            if game_stat.date == game_date:
-                logger.info(
-                    f"Found exact opponent for {game_date}: {game_stat.opponent}"
-                )
-                return game_stat.opponent
-
-        # Strategy 2: Check preseason games for exact date match
-        from parsers.date_resolver import lookup_player_team
-        from services.preseason_schedule_service import PreseasonScheduleService
+        opponent = opponents_by_date.get(game_date)
+        if opponent is not None:
+            logger.info(f"Found exact opponent for {game_date}: {opponent}")
+            return opponent
+
+        # Strategy 2: Check preseason games for exact date match. Only started
+        # once Strategy 1 misses, so exact matches never leave it running
+        team_name, preseason_service, team_dates = await _shared_task(
+            season_cache,
+            ("preseason", player_name, season),
+            lambda: _fetch_player_preseason(player_name, season),
+        )
 
-        team_name = lookup_player_team(player_name)
-        if team_name:
-            async with PreseasonScheduleService() as preseason_service:
-                team_dates = await preseason_service.get_team_preseason_dates(
-                    team_name, season
+        # An empty schedule is cached too, so teams without preseason games
+        # skip this strategy for every other row
+        if team_dates and game_date in team_dates:
+            opponent = await _get_preseason_opponent(
+                preseason_service, team_name, game_date, season
+            )
+            if opponent:
+                logger.info(
+                    f"Found exact preseason opponent for {game_date}: {opponent}"
                 )
-
-                if game_date in team_dates:
-                    opponent = await _get_preseason_opponent(
-                        preseason_service, team_name, game_date, season
-                    )
-                    if opponent:
-                        logger.info(
-                            f"Found exact preseason opponent for {game_date}: {opponent}"
-                        )
-                        return opponent
+                return opponent
 
         # Strategy 3: Use existing milestone logic - find most recent actual game
-        from utils.player_game_logs import get_player_recent_game
-
         # Find the most recent game before the target date (within 60 days)
         recent_game_date = await get_player_recent_game(player_name, game_date)
 
         if recent_game_date:
             # Get the opponent for that actual game
-            for game_stat in game_stats_list:
-                if game_stat.date == recent_game_date:
-                    logger.info(
-                        f"Found recent game opponent for {game_date}: {game_stat.opponent} (from {recent_game_date})"
-                    )
-                    return game_stat.opponent
+            opponent = opponents_by_date.get(recent_game_date)
+            if opponent is not None:
+                logger.info(
+                    f"Found recent game opponent for {game_date}: {opponent} (from {recent_game_date})"
+                )
+                return opponent
 
         # If we get here, no games found (shouldn't happen with valid player data)
         logger.warning(f"No opponent resolution possible for {game_date}")
@@ -137,115 +258,52 @@ async def _get_preseason_opponent(
         return None
 
 
-async def _find_nearest_game_opponent(game_stats_list, target_date: date) -> str:
-    """
-    Find the opponent from the nearest actual game (within 7 days)
-    """
-    try:
-        nearest_game = None
-        min_diff = float("inf")
-
-        for game_stat in game_stats_list:
-            diff = abs((game_stat.date - target_date).days)
-            if diff <= 7 and diff < min_diff:  # Within 7 days
-                min_diff = diff
-                nearest_game = game_stat
-
-        if nearest_game:
-            return f"{nearest_game.opponent} (±{min_diff}d)"
-
-        return None
-    except Exception as e:
-        logger.debug(f"Error finding nearest game opponent: {e}")
-        return None
-
-
-async def _get_most_common_season_opponent(game_stats_list, season_year: int) -> str:
-    """
-    Get the most frequently played opponent from that season or fallback to most recent available data
-    """
-    try:
-        from collections import Counter
-
-        # First try to get games from the requested season
-        season_games = [
-            game for game in game_stats_list if game.date.year == season_year
-        ]
-
-        if season_games:
-            # Found games for the requested season - use them
-            opponent_counts = Counter(game.opponent for game in season_games)
-            most_common_opponent, count = opponent_counts.most_common(1)[0]
-            return most_common_opponent  # Return just the team name, not the count
-
-        # No games for requested season - use most recent available data
-        if game_stats_list:
-            # Use all available games (likely 2024)
-            opponent_counts = Counter(game.opponent for game in game_stats_list)
-            most_common_opponent, count = opponent_counts.most_common(1)[0]
-
-            # Filter out non-team opponents like "Team USA"
-            valid_opponents = [
-                opponent
-                for opponent, _ in opponent_counts.most_common()
-                if opponent not in ["Team USA", "Olympic Team", "USA Basketball"]
-            ]
-
-            if valid_opponents:
-                # Get the most common valid team opponent
-                most_common_valid = opponent_counts[valid_opponents[0]]
-                return valid_opponents[0]  # Return just the team name
-            else:
-                return most_common_opponent  # Fallback to any opponent
-
-        return None
-
-    except Exception as e:
-        logger.debug(f"Error getting most common season opponent: {e}")
-        return None
-
-
-def _get_fallback_opponent(season_year: int) -> str:
-    """
-    Get a generic fallback opponent based on season and league knowledge
-    """
-    # WNBA teams that commonly play against Indiana Fever
-    common_opponents = [
-        "Sun",
-        "Liberty",
-        "Aces",
-        "Storm",
-        "Lynx",
-        "Wings",
-        "Dream",
-        "Sky",
-        "Sparks",
-        "Mercury",
-        "Mystics",
-    ]
-
-    if season_year >= 2025:
-        return "Season Opponent"
-    elif season_year == 2024:
-        return "WNBA Opponent"
-    else:
-        return "League Opponent"
-
-
 class KixStatsService:
     """Service for scraping game shoe data from KixStats.com"""
 
-    def __init__(self):
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = HTML_CACHE_DIR,
+        cache_ttl: int = HTML_CACHE_TTL,
+    ):
+        """
+        Initialize KixStats service
+
+        Args:
+            cache_dir: Directory for cached player pages (None disables it)
+            cache_ttl: Seconds before a cached page is fetched again
+        """
         self.base_url = "https://kixstats.com"
-        self.session = None
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.cache_dir = cache_dir
+        self.cache_ttl = cache_ttl
 
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        self._get_session()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
+        await self.close()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it on first use"""
+        if self.session is None or self.session.closed:
+            # Few sockets per host keeps KixStats from throttling us
+            connector = aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=2,
+                keepalive_timeout=60,
+                ttl_dns_cache=600,
+                enable_cleanup_closed=True,
+            )
+            self.session = aiohttp.ClientSession(connector=connector)
+        return self.session
+
+    async def close(self) -> None:
+        """Close the shared HTTP session"""
+        if self.session and not self.session.closed:
             await self.session.close()
+        self.session = None
 
     async def scrape_player_games(
         self, player_id: str, player_name: str = ""
@@ -264,11 +322,9 @@ class KixStatsService:
         logger.info(f"Scraping KixStats data from: {url}")
 
         try:
-            if not self.session:
-                async with aiohttp.ClientSession() as session:
-                    return await self._scrape_with_session(session, url, player_name)
-            else:
-                return await self._scrape_with_session(self.session, url, player_name)
+            return await self._scrape_with_session(
+                self._get_session(), url, player_name
+            )
 
         except Exception as e:
             logger.error(f"Error scraping KixStats data: {e}")
@@ -279,8 +335,17 @@ class KixStatsService:
     ) -> List[GameShoeData]:
         """Internal method to scrape with provided session"""
 
-        # Add respectful delay
-        await asyncio.sleep(2)
+        cached = self._read_html_cache(url)
+        if cached is not None:
+            logger.info(f"Using cached KixStats page for {url}")
+            html, encoding = cached
+            rows = self._find_game_rows(html, encoding)
+            if rows is None:
+                return []
+            return await self._parse_game_rows(rows, player_name)
+
+        # Space out fetches; only waits when requests come back-to-back
+        await wait_for_kixstats_rate_limit()
 
         headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
@@ -291,41 +356,104 @@ class KixStatsService:
                 logger.error(f"Failed to fetch KixStats page: HTTP {response.status}")
                 return []
 
-            html = await response.text()
-            return await self._parse_games_table(html, player_name)
+            # Hand lxml raw bytes plus the header charset (if any); without a
+            # header charset it falls back to the page's meta tag
+            html = await response.read()
+            encoding = response.charset
 
-    async def _parse_games_table(
-        self, html: str, player_name: str
-    ) -> List[GameShoeData]:
-        """Parse the games table from HTML"""
+        # Only cache pages that actually have the games table, so a challenge
+        # or error page isn't replayed for the whole cache TTL
+        rows = self._find_game_rows(html, encoding)
+        if rows is None:
+            return []
+        self._write_html_cache(url, html, encoding)
+        return await self._parse_game_rows(rows, player_name)
+
+    def _html_cache_path(self, url: str) -> Optional[Path]:
+        """Cache file for a page URL, or None when caching is disabled"""
+        if not self.cache_dir:
+            return None
+        return self.cache_dir / f"{hashlib.sha1(url.encode()).hexdigest()}.page"
+
+    def _read_html_cache(self, url: str) -> Optional[Tuple[bytes, Optional[str]]]:
+        """
+        Return a cached (page body, charset) if it is younger than the cache TTL
+
+        Cache files hold the HTTP charset on the first line (empty when the
+        response had none), followed by the raw page body.
+        """
+        cache_path = self._html_cache_path(url)
+        if not cache_path:
+            return None
+
+        try:
+            if time.time() - cache_path.stat().st_mtime >= self.cache_ttl:
+                return None
+            charset, _, html = cache_path.read_bytes().partition(b"\n")
+            return html, charset.decode("latin-1") or None
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.debug(f"Failed to read KixStats page cache: {e}")
+            return None
+
+    def _write_html_cache(
+        self, url: str, html: bytes, encoding: Optional[str] = None
+    ) -> None:
+        """Persist a fetched page body and its HTTP charset for later runs"""
+        cache_path = self._html_cache_path(url)
+        if not cache_path:
+            return
+
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # Write then rename so an interrupted run never leaves a partial page
+            tmp_path = cache_path.with_suffix(".tmp")
+            tmp_path.write_bytes((encoding or "").encode("latin-1") + b"\n" + html)
+            tmp_path.replace(cache_path)
+        except OSError as e:
+            logger.debug(f"Failed to write KixStats page cache: {e}")
+
+    def _find_game_rows(
+        self, html: bytes, encoding: Optional[str] = None
+    ) -> Optional[list]:
+        """Return the games table rows from HTML, or None if there is no table"""
 
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, "lxml", from_encoding=encoding)
 
         # Find the games table
         table = soup.find("table", class_="table ttable")
         if not table:
             logger.error("Could not find games table with class 'table ttable'")
-            return []
+            return None
 
         tbody = table.find("tbody")
         if not tbody:
             logger.error("Could not find tbody in games table")
-            return []
+            return None
 
-        games = []
-        rows = tbody.find_all("tr")
+        return tbody.find_all("tr")
+
+    async def _parse_game_rows(
+        self, rows: list, player_name: str
+    ) -> List[GameShoeData]:
+        """Parse games table rows and resolve each game's opponent"""
+
+        parsed_games = []
 
         logger.info(f"Found {len(rows)} game rows to parse")
 
         for row in rows:
             try:
-                game_data = await self._parse_game_row_with_opponent(row, player_name)
+                game_data = self._parse_game_row(row, player_name)
                 if game_data:
-                    games.append(game_data)
+                    parsed_games.append(game_data)
             except Exception as e:
                 logger.error(f"Error parsing game row: {e}")
                 continue
 
+        games = await self._resolve_opponents(parsed_games, player_name)
+
         logger.info(f"Successfully parsed {len(games)} games")
         return games
 
@@ -340,7 +468,7 @@ class KixStatsService:
         try:
             # Parse date (first column)
             date_text = cells[0].get_text(strip=True)
-            game_date = datetime.strptime(date_text, "%Y-%m-%d").date()
+            game_date = date.fromisoformat(date_text)
 
             # Parse shoe name and URL (third column)
             shoe_link = cells[2].find("a")
@@ -358,9 +486,7 @@ class KixStatsService:
 
             # 1. Get shoe product image from column 1 (kickstats links)
             images_cell = cells[1]
-            kickstats_links = images_cell.find_all(
-                "a", href=lambda href: href and "kickstats" in href
-            )
+            kickstats_links = images_cell.select('a[href*="kickstats"]')
             for link in kickstats_links:
                 img_tag = link.find("img")
                 if img_tag:
@@ -376,9 +502,7 @@ class KixStatsService:
             # 2. Get game photo from column 3 (4th column) if available
             if len(cells) > 3:
                 game_photo_cell = cells[3]  # Column 3 = 4th column (0-indexed)
-                game_photo_links = game_photo_cell.find_all(
-                    "a", href=lambda href: href and "/img/games/" in str(href)
-                )
+                game_photo_links = game_photo_cell.select('a[href*="/img/games/"]')
                 for link in game_photo_links:
                     img_tag = link.find("img")
                     if img_tag:
@@ -391,27 +515,15 @@ class KixStatsService:
                             break  # Use the first game photo
 
             # Format as JSON array string or empty string if no images
-            import json
-
             image_url = json.dumps(image_urls) if image_urls else ""
 
             # Parse stats (columns 5-10: Min, Pts, Reb, Ast, Stl, Blk)
-            def parse_stat(cell) -> int:
-                span = cell.find("span")
-                if span:
-                    text = span.get_text(strip=True)
-                    try:
-                        return int(text)
-                    except ValueError:
-                        return 0
-                return 0
-
-            minutes = parse_stat(cells[4])
-            points = parse_stat(cells[5])
-            rebounds = parse_stat(cells[6])
-            assists = parse_stat(cells[7])
-            steals = parse_stat(cells[8])
-            blocks = parse_stat(cells[9])
+            minutes = _parse_stat_cell(cells[4])
+            points = _parse_stat_cell(cells[5])
+            rebounds = _parse_stat_cell(cells[6])
+            assists = _parse_stat_cell(cells[7])
+            steals = _parse_stat_cell(cells[8])
+            blocks = _parse_stat_cell(cells[9])
 
             return GameShoeData(
                 game_date=game_date,
@@ -431,52 +543,46 @@ class KixStatsService:
             logger.error(f"Error parsing game row data: {e}")
             return None
 
-    async def _parse_game_row_with_opponent(
-        self, row, player_name: str
-    ) -> Optional[GameShoeData]:
-        """Parse game row and resolve opponent using existing game log infrastructure"""
-        try:
-            # First parse the basic game data
-            game_data = self._parse_game_row(row, player_name)
-            if not game_data:
-                return None
-
-            # Resolve opponent using existing game log infrastructure
-            opponent = await resolve_shoe_opponent(game_data.game_date, player_name)
+    async def _resolve_opponents(
+        self, games: List[GameShoeData], player_name: str
+    ) -> List[GameShoeData]:
+        """Resolve opponents for parsed games concurrently using game log data"""
+        semaphore = asyncio.Semaphore(OPPONENT_RESOLUTION_CONCURRENCY)
+        # One game log / preseason fetch per season for this table
+        season_cache: Dict[Tuple, asyncio.Future] = {}
+
+        async def resolve(game_data: GameShoeData) -> str:
+            async with semaphore:
+                return await resolve_shoe_opponent(
+                    game_data.game_date, player_name, season_cache
+                )
 
-            # Create new GameShoeData with the resolved opponent
-            return GameShoeData(
-                game_date=game_data.game_date,
-                shoe_name=game_data.shoe_name,
-                shoe_url=game_data.shoe_url,
-                minutes=game_data.minutes,
-                points=game_data.points,
-                rebounds=game_data.rebounds,
-                assists=game_data.assists,
-                steals=game_data.steals,
-                blocks=game_data.blocks,
-                player_name=game_data.player_name,
-                image_url=game_data.image_url,
-                opponent=opponent,  # Use resolved opponent instead of default "Unknown"
+        try:
+            opponents = await asyncio.gather(
+                *(resolve(game_data) for game_data in games), return_exceptions=True
             )
+        finally:
+            # Don't leave shared lookups running if a caller was cancelled
+            for task in season_cache.values():
+                task.cancel()
+
+        resolved = []
+        for game_data, opponent in zip(games, opponents):
+            if isinstance(opponent, Exception):
+                logger.error(
+                    f"Error resolving opponent for {game_data.game_date}: {opponent}"
+                )
+                resolved.append(game_data)
+            else:
+                resolved.append(replace(game_data, opponent=opponent))
 
-        except Exception as e:
-            logger.error(f"Error parsing game row with opponent: {e}")
-            return None
+        return resolved
 
     @staticmethod
     def get_player_id_from_name(player_name: str) -> str:
         """Convert player name to KixStats player ID format"""
-        # Map of known player names to verified KixStats IDs
-        player_id_map = {
-            "caitlin clark": "caitlin-clark-44",
-            "paige bueckers": "paige-bueckers-19",
-            "aja wilson": "aja-wilson",
-            "a'ja wilson": "aja-wilson",  # Handle apostrophe variation
-            "angel reese": "angel-reese-73",
-            "cameron brink": "cameron-brink-41",
-            "napheesa collier": "napheesa-collier",
-        }
-
         normalized = player_name.lower()
-        return player_id_map.get(normalized, f"{normalized.replace(' ', '-')}-unknown")
+        player_id = PLAYER_ID_MAP.get(normalized)
+        if player_id:
+            return player_id
+        return f"{normalized.replace(' ', '-')}-unknown"
@@ -3,19 +3,30 @@ Monitoring Service
 Tracks scraper metrics and health for production monitoring
 """
 
-import json
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
+from collections import defaultdict
+
+import orjson
 
 from config.settings import SCRAPER_TYPES
 
 logger = logging.getLogger(__name__)
 
+# Metrics older than this are dropped from the metrics file
+METRICS_RETENTION_DAYS = 90
+
+# Only rewrite the file once the oldest row is this far past the retention window
+METRICS_PRUNE_SLACK = timedelta(days=1)
+
+# Write buffer for metrics appends
+METRICS_WRITE_BUFFER = 1 << 16
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class ScraperRunMetrics:
     """Metrics for a single scraper run"""
 
@@ -34,9 +45,17 @@ class MonitoringService:
     """Service for tracking scraper metrics and health"""
 
     def __init__(self, metrics_file: Optional[Path] = None):
-        self.metrics_file = metrics_file or Path("output/scraper_metrics.json")
+        self.metrics_file = metrics_file or Path("output/scraper_metrics.jsonl")
         self.metrics_file.parent.mkdir(parents=True, exist_ok=True)
 
+        # Loaded metrics indexed by ISO day ("YYYY-MM-DD"), reused until the
+        # file changes
+        self._metrics: Optional[List[Dict]] = None
+        self._metrics_stat: Optional[Tuple[int, int]] = None
+        self._by_date: Dict[str, List[Dict]] = {}
+
+        self._migrate_legacy_metrics()
+
     def log_scraper_run(
         self,
         scraper_type: str,
@@ -74,14 +93,13 @@ class MonitoringService:
                 date_range=date_range,
             )
 
-            # Load existing metrics
-            all_metrics = self._load_metrics()
+            # Append one JSON line instead of rewriting the whole file;
+            # orjson serializes the dataclass directly, no asdict() copy
+            with open(self.metrics_file, "ab", buffering=METRICS_WRITE_BUFFER) as f:
+                f.write(orjson.dumps(metrics) + b"\n")
 
-            # Append new metrics
-            all_metrics.append(asdict(metrics))
-
-            # Save metrics
-            self._save_metrics(all_metrics)
+            self._prune_metrics_if_due()
+            self._metrics = None
 
             logger.info(
                 f"Logged {scraper_type} scraper run: {items_found} items, {posts_processed} posts, {duration_seconds:.1f}s"
@@ -104,14 +122,8 @@ class MonitoringService:
             date = datetime.now()
 
         target_date = date.date()
-        all_metrics = self._load_metrics()
-
-        # Filter metrics for target date
-        daily_metrics = []
-        for metric in all_metrics:
-            metric_date = datetime.fromisoformat(metric["timestamp"]).date()
-            if metric_date == target_date:
-                daily_metrics.append(metric)
+        self._get_metrics()
+        daily_metrics = self._by_date.get(target_date.isoformat(), [])
 
         if not daily_metrics:
             return {
@@ -125,31 +137,33 @@ class MonitoringService:
                 "scraper_types": {},
             }
 
-        # Calculate summary statistics
+        # Calculate summary statistics and group by scraper type in one pass
         total_runs = len(daily_metrics)
-        successful_runs = sum(1 for m in daily_metrics if m["success"])
-        failed_runs = total_runs - successful_runs
-        total_items = sum(m["items_found"] for m in daily_metrics)
-        total_posts = sum(m["posts_processed"] for m in daily_metrics)
-        total_duration = sum(m["duration_seconds"] for m in daily_metrics)
-
-        # Group by scraper type
-        scraper_types = {}
+        successful_runs = 0
+        total_items = 0
+        total_posts = 0
+        total_duration = 0
+        scraper_types = defaultdict(
+            lambda: {"runs": 0, "items": 0, "posts": 0, "success": 0}
+        )
         for metric in daily_metrics:
-            scraper_type = metric["scraper_type"]
-            if scraper_type not in scraper_types:
-                scraper_types[scraper_type] = {
-                    "runs": 0,
-                    "items": 0,
-                    "posts": 0,
-                    "success": 0,
-                }
-
-            scraper_types[scraper_type]["runs"] += 1
-            scraper_types[scraper_type]["items"] += metric["items_found"]
-            scraper_types[scraper_type]["posts"] += metric["posts_processed"]
-            if metric["success"]:
-                scraper_types[scraper_type]["success"] += 1
+            items = metric["items_found"]
+            posts = metric["posts_processed"]
+            success = metric["success"]
+
+            total_items += items
+            total_posts += posts
+            total_duration += metric["duration_seconds"]
+
+            type_stats = scraper_types[metric["scraper_type"]]
+            type_stats["runs"] += 1
+            type_stats["items"] += items
+            type_stats["posts"] += posts
+            if success:
+                successful_runs += 1
+                type_stats["success"] += 1
+
+        failed_runs = total_runs - successful_runs
 
         return {
             "date": target_date.isoformat(),
@@ -159,7 +173,7 @@ class MonitoringService:
             "total_items": total_items,
             "total_posts": total_posts,
             "total_duration": round(total_duration, 1),
-            "scraper_types": scraper_types,
+            "scraper_types": dict(scraper_types),
         }
 
     def check_health(self, days_threshold: int = 7) -> Dict:
@@ -172,7 +186,7 @@ class MonitoringService:
         Returns:
             Dictionary with health status and warnings
         """
-        all_metrics = self._load_metrics()
+        all_metrics = self._get_metrics()
 
         if not all_metrics:
             return {
@@ -181,13 +195,18 @@ class MonitoringService:
                 "last_successful_run": None,
             }
 
-        # Get recent metrics (last 3 days for activity check)
-        activity_cutoff = datetime.now() - timedelta(days=3)
-        recent_metrics = [
-            m
-            for m in all_metrics
-            if datetime.fromisoformat(m["timestamp"]) > activity_cutoff
-        ]
+        # Get recent metrics (last 3 days for activity check). ISO timestamps
+        # sort chronologically, so compare the strings instead of parsing them
+        now = datetime.now()
+        activity_cutoff = (now - timedelta(days=3)).isoformat()
+        recent_metrics = []
+        for day_offset in range(3, -1, -1):
+            day = (now - timedelta(days=day_offset)).date().isoformat()
+            recent_metrics.extend(
+                m
+                for m in self._by_date.get(day, ())
+                if m["timestamp"] > activity_cutoff
+            )
 
         if not recent_metrics:
             return {
@@ -196,13 +215,22 @@ class MonitoringService:
                 "last_successful_run": None,
             }
 
-        # Find last successful run
-        successful_runs = [m for m in recent_metrics if m["success"]]
+        # Find last successful run, error rate, scraper types and successful
+        # zero-item runs (normal behavior) in one pass
         last_successful = None
-        if successful_runs:
-            last_successful = max(successful_runs, key=lambda m: m["timestamp"])[
-                "timestamp"
-            ]
+        failed_runs = 0
+        successful_zero_items = 0
+        scraper_types_seen = set()
+        for m in recent_metrics:
+            scraper_types_seen.add(m["scraper_type"])
+            if m["success"]:
+                timestamp = m["timestamp"]
+                if last_successful is None or timestamp > last_successful:
+                    last_successful = timestamp
+                if m["items_found"] == 0:
+                    successful_zero_items += 1
+            else:
+                failed_runs += 1
 
         # Check for consecutive days with failed runs (not zero results)
         warnings = []
@@ -216,14 +244,13 @@ class MonitoringService:
             )
 
         # Check for high error rates
-        error_rate = self._calculate_error_rate(recent_metrics)
+        error_rate = failed_runs / len(recent_metrics)
         if error_rate > 0.5:  # More than 50% failures
             warnings.append(
                 f"High error rate: {error_rate*100:.1f}% of runs failed in last 3 days"
             )
 
         # Check for specific scraper types not running
-        scraper_types_seen = set(m["scraper_type"] for m in recent_metrics)
         expected_types = set(SCRAPER_TYPES)
         missing_types = expected_types - scraper_types_seen
 
@@ -234,52 +261,126 @@ class MonitoringService:
 
         healthy = len(warnings) == 0
 
-        # Count successful runs with zero items (normal behavior)
-        successful_zero_items = [
-            m for m in recent_metrics if m["success"] and m["items_found"] == 0
-        ]
-
         return {
             "healthy": healthy,
             "warnings": warnings,
             "last_successful_run": last_successful,
             "recent_runs": len(recent_metrics),
             "error_rate": round(error_rate, 2),
-            "successful_zero_item_runs": len(successful_zero_items),
+            "successful_zero_item_runs": successful_zero_items,
             "note": "Zero items found in successful runs is normal when no new data is available",
         }
 
+    def _get_metrics(self) -> List[Dict]:
+        """Return loaded metrics, reloading and re-indexing if the file changed"""
+        # Size catches appends that land within the filesystem's mtime granularity
+        try:
+            st = self.metrics_file.stat()
+            file_stat = (st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
+            file_stat = None
+
+        if self._metrics is None or file_stat != self._metrics_stat:
+            self._metrics = self._load_metrics()
+            self._metrics_stat = file_stat
+
+            by_date = defaultdict(list)
+            for metric in self._metrics:
+                by_date[metric["timestamp"][:10]].append(metric)
+            self._by_date = dict(by_date)
+
+        return self._metrics
+
     def _load_metrics(self) -> List[Dict]:
-        """Load metrics from JSON file"""
+        """Load metrics from JSON-lines file"""
         if not self.metrics_file.exists():
             return []
 
+        metrics = []
         try:
-            with open(self.metrics_file, "r") as f:
-                return json.load(f)
-        except json.JSONDecodeError:
-            logger.error(f"Corrupted metrics file: {self.metrics_file}")
-            return []
+            with open(self.metrics_file, "rb") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        metric = orjson.loads(line)
+                    except orjson.JSONDecodeError:
+                        logger.error(
+                            f"Skipping corrupted metrics line in {self.metrics_file}"
+                        )
+                        continue
+                    metrics.append(metric)
         except Exception as e:
             logger.error(f"Failed to load metrics: {e}")
             return []
 
-    def _save_metrics(self, metrics: List[Dict]) -> None:
-        """Save metrics to JSON file"""
+        return metrics
+
+    def _migrate_legacy_metrics(self) -> None:
+        """
+        Import metrics from the old JSON-array file into the JSON-lines file
+
+        Older versions stored all runs as one array in scraper_metrics.json.
+        Its rows are written ahead of any rows already in the JSON-lines file
+        (keeping the file chronological), then the old file is renamed so the
+        import runs only once.
+        """
+        legacy_file = self.metrics_file.with_suffix(".json")
+        if legacy_file == self.metrics_file or not legacy_file.exists():
+            return
+
+        try:
+            legacy_metrics = orjson.loads(legacy_file.read_bytes())
+
+            tmp_file = self.metrics_file.with_suffix(".tmp")
+            with open(tmp_file, "wb", buffering=METRICS_WRITE_BUFFER) as f:
+                for m in legacy_metrics:
+                    f.write(orjson.dumps(m) + b"\n")
+                if self.metrics_file.exists():
+                    f.write(self.metrics_file.read_bytes())
+            tmp_file.replace(self.metrics_file)
+            legacy_file.rename(legacy_file.with_suffix(".json.migrated"))
+
+            logger.info(
+                f"Migrated {len(legacy_metrics)} metrics from {legacy_file} to {self.metrics_file}"
+            )
+
+        except Exception as e:
+            logger.error(f"Failed to migrate legacy metrics file {legacy_file}: {e}")
+
+    def _prune_metrics_if_due(self) -> None:
+        """
+        Drop metrics older than the retention window
+
+        Rows are appended in chronological order, so only the first line needs
+        to be read to decide whether a rewrite is due. The file is rewritten at
+        most about once per day instead of on every append.
+        """
         try:
-            # Keep only last 90 days of metrics
-            cutoff_date = datetime.now() - timedelta(days=90)
+            with open(self.metrics_file, "rb") as f:
+                first_line = f.readline()
+            if not first_line.strip():
+                return
+
+            # ISO timestamps sort chronologically, so compare them as strings
+            cutoff_date = datetime.now() - timedelta(days=METRICS_RETENTION_DAYS)
+            cutoff_str = cutoff_date.isoformat()
+            prune_after = (cutoff_date - METRICS_PRUNE_SLACK).isoformat()
+            if orjson.loads(first_line)["timestamp"] > prune_after:
+                return
+
             filtered_metrics = [
-                m
-                for m in metrics
-                if datetime.fromisoformat(m["timestamp"]) > cutoff_date
+                m for m in self._load_metrics() if m["timestamp"] > cutoff_str
             ]
 
-            with open(self.metrics_file, "w") as f:
-                json.dump(filtered_metrics, f, indent=2)
+            tmp_file = self.metrics_file.with_suffix(".tmp")
+            with open(tmp_file, "wb", buffering=METRICS_WRITE_BUFFER) as f:
+                for m in filtered_metrics:
+                    f.write(orjson.dumps(m) + b"\n")
+            tmp_file.replace(self.metrics_file)
 
         except Exception as e:
-            logger.error(f"Failed to save metrics: {e}")
+            logger.error(f"Failed to prune metrics: {e}")
 
     def _check_consecutive_failed_runs(
         self, metrics: List[Dict], threshold: int
@@ -288,7 +389,7 @@ class MonitoringService:
         # Group metrics by date and check if all runs failed
         dates_with_failures = {}
         for metric in metrics:
-            metric_date = datetime.fromisoformat(metric["timestamp"]).date()
+            metric_date = metric["timestamp"][:10]
             if metric_date not in dates_with_failures:
                 dates_with_failures[metric_date] = []
             dates_with_failures[metric_date].append(metric["success"])
@@ -299,7 +400,7 @@ class MonitoringService:
 
         # Check last N days
         for i in range(threshold + 1):
-            check_date = (datetime.now() - timedelta(days=i)).date()
+            check_date = (datetime.now() - timedelta(days=i)).date().isoformat()
             if check_date in dates_with_failures:
                 # Check if ALL runs on this day failed
                 day_successes = dates_with_failures[check_date]
@@ -314,13 +415,3 @@ class MonitoringService:
                 max_consecutive = max(max_consecutive, consecutive_failures)
 
         return max_consecutive
-
-    def _calculate_error_rate(self, metrics: List[Dict]) -> float:
-        """Calculate error rate from metrics"""
-        if not metrics:
-            return 0.0
-
-        total_runs = len(metrics)
-        failed_runs = sum(1 for m in metrics if not m["success"])
-
-        return failed_runs / total_runs if total_runs > 0 else 0.0
@@ -52,6 +52,11 @@ class PhotoAggregationService:
         self.instagram_service = instagram_service
         self.twitter_client = twitter_client
 
+    async def close(self) -> None:
+        """Release HTTP resources held by the underlying photo services"""
+        if self.instagram_service:
+            await self.instagram_service.close()
+
     async def get_all_tunnel_photos(
         self,
         player_name: str,